@@ -1,15 +1,61 @@
-from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Callable, Optional
 from ..products.base import RequestParser, ResponseBuilder
 
-class PayGateFactory(ABC):
+@dataclass(frozen=True, slots=True)
+class PayGateFactory:
     """
-    Abstract Factory to produce request parsers and response builders for gateways.
+    Factory bundling the request parser and response builder for a gateway.
+
+    Instances are shared by every payment, so parsers and builders
+    must remain stateless.
+
+    When ``gateway`` is given and the parser and builder follow the
+    ``{gateway}_parsed`` / ``{gateway}_response`` envelope convention,
+    ``pipeline`` builds the final response in a single expression. The
+    convention is checked against the products once, at construction; a
+    factory without a tag, or whose products do anything else, falls back
+    to calling the parser and builder on every payment.
     """
 
-    @abstractmethod
-    def create_request_parser(self) -> RequestParser:
-        pass
+    parser: RequestParser
+    builder: ResponseBuilder
+    gateway: Optional[str] = None
+    pipeline: Callable[[dict], dict] = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "pipeline", self.compile_pipeline())
+
+    def compile_pipeline(self) -> Callable[[dict], dict]:
+        """
+        Return a function taking raw request data to the gateway response.
+        """
+        if self.gateway is None or not self._follows_envelope():
+            parser, builder = self.parser, self.builder
+
+            def process(data: dict) -> dict:
+                # Simulate business logic here (e.g., send to processor)
+                return builder.build({"status": "approved", "parsed": parser.parse(data)})
+
+            return process
+
+        parsed_key = f"{self.gateway}_parsed"
+        response_key = f"{self.gateway}_response"
+
+        def process(data: dict) -> dict:
+            return {response_key: {"status": "approved", "parsed": {parsed_key: data}}}
+
+        return process
 
-    @abstractmethod
-    def create_response_builder(self) -> ResponseBuilder:
-        pass
+    def _follows_envelope(self) -> bool:
+        """
+        Check that parse/build only wrap their input under the gateway's keys.
+        """
+        parsed_key = f"{self.gateway}_parsed"
+        response_key = f"{self.gateway}_response"
+        probe = {}
+        parsed = self.parser.parse(probe)
+        if parsed != {parsed_key: probe} or parsed[parsed_key] is not probe:
+            return False
+        built = self.builder.build(probe)
+        return built == {response_key: probe} and built[response_key] is probe
@@ -1,25 +1,23 @@
-from abc import ABC, abstractmethod
+from typing import Protocol
 
-class RequestParser(ABC):
+class RequestParser(Protocol):
     """
-    Abstract base class for request parsers used by payment gateways.
+    Structural interface for request parsers used by payment gateways.
     """
 
-    @abstractmethod
     def parse(self, data: dict) -> dict:
         """
         Parse raw request data into gateway-specific format.
         """
-        pass
+        ...
 
-class ResponseBuilder(ABC):
+class ResponseBuilder(Protocol):
     """
-    Abstract base class for response builders used by payment gateways.
+    Structural interface for response builders used by payment gateways.
     """
 
-    @abstractmethod
     def build(self, result: dict) -> dict:
         """
         Build response data from processing result.
         """
-        pass
+        ...
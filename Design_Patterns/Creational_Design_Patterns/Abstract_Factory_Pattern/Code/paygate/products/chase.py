@@ -1,9 +1,14 @@
-from base import RequestParser, ResponseBuilder
+# Both products follow the envelope convention PayGateFactory checks at
+# construction: parse -> {"chase_parsed": data}, build -> {"chase_response": result}.
+# Output of any other shape makes the factory call these on every payment.
+class ChaseRequestParser:
+    __slots__ = ()
 
-class ChaseRequestParser(RequestParser):
     def parse(self, data: dict) -> dict:
         return {"chase_parsed": data}
 
-class ChaseResponseBuilder(ResponseBuilder):
+class ChaseResponseBuilder:
+    __slots__ = ()
+
     def build(self, result: dict) -> dict:
         return {"chase_response": result}
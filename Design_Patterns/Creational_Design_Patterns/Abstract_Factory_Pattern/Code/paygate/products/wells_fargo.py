@@ -1,9 +1,14 @@
-from base import RequestParser, ResponseBuilder
+# Both products follow the envelope convention PayGateFactory checks at
+# construction: parse -> {"wells_parsed": data}, build -> {"wells_response": result}.
+# Output of any other shape makes the factory call these on every payment.
+class WellsFargoRequestParser:
+    __slots__ = ()
 
-class WellsFargoRequestParser(RequestParser):
     def parse(self, data: dict) -> dict:
         return {"wells_parsed": data}
 
-class WellsFargoResponseBuilder(ResponseBuilder):
+class WellsFargoResponseBuilder:
+    __slots__ = ()
+
     def build(self, result: dict) -> dict:
         return {"wells_response": result}
@@ -2,12 +2,16 @@ from gateways.stripe import StripeAdapter
 from gateways.paypal import PayPalAdapter
 from gateways.base import PaymentGatewayAdapter
 
+# Adapters are stateless, so a single shared instance per provider is enough.
+_GATEWAYS = {
+    "stripe": StripeAdapter(),
+    "paypal": PayPalAdapter(),
+}
+
 class PaymentGatewayFactory:
     @staticmethod
     def get_gateway(provider_name: str) -> PaymentGatewayAdapter:
-        if provider_name == "stripe":
-            return StripeAdapter()
-        elif provider_name == "paypal":
-            return PayPalAdapter()
-        else:
-            raise ValueError(f"Unsupported provider: {provider_name}")
+        try:
+            return _GATEWAYS[provider_name]
+        except KeyError:
+            raise ValueError(f"Unsupported provider: {provider_name}") from None
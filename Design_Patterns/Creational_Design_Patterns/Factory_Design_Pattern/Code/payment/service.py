@@ -1,17 +1,19 @@
-from gateways.base import PaymentGatewayAdapter, GiftCardCapable
+from gateways.base import PaymentGatewayAdapter
 from factory import PaymentGatewayFactory
 
 class PaymentService:
     def __init__(self, gateway: PaymentGatewayAdapter):
         self.gateway = gateway
+        # Resolved once: None when the gateway has no gift card support.
+        self._gift_card_fn = getattr(gateway, "process_gift_card", None)
 
     def make_payment(self, amount, currency, card_info):
         return self.gateway.charge(amount, currency, card_info)
 
     def process_gift_card_payment(self, gift_card_code, amount):
-        if isinstance(self.gateway, GiftCardCapable):
-            return self.gateway.process_gift_card(gift_card_code, amount)
-        raise NotImplementedError("Gift card processing not supported")
+        if self._gift_card_fn is None:
+            raise NotImplementedError("Gift card processing not supported")
+        return self._gift_card_fn(gift_card_code, amount)
 
 if __name__ == '__main__':
     gateway_type = PaymentGatewayFactory.get_gateway("stripe")
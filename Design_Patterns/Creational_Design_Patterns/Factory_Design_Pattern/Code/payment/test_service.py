@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 from service import PaymentService
+from factory import PaymentGatewayFactory
 from gateways.base import PaymentGatewayAdapter, GiftCardCapable
 
 
@@ -32,3 +33,16 @@ def test_process_gift_card_not_supported():
 
     with pytest.raises(NotImplementedError):
         service.process_gift_card_payment("GC999", 25.0)
+
+
+def test_get_gateway_unknown_provider():
+    with pytest.raises(ValueError, match="Unsupported provider: unknown"):
+        PaymentGatewayFactory.get_gateway("unknown")
+
+
+def test_get_gateway_returns_shared_adapter():
+    first = PaymentGatewayFactory.get_gateway("stripe")
+
+    assert isinstance(first, PaymentGatewayAdapter)
+    assert PaymentGatewayFactory.get_gateway("stripe") is first
+    assert PaymentGatewayFactory.get_gateway("paypal") is not first
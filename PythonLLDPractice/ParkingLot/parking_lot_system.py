@@ -1,15 +1,20 @@
 # Enums and Vehicle
 from enum import Enum
-from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 import heapq
 import logging
 import os
+import time
 from logging.handlers import RotatingFileHandler
 
 def setup_logger():
     logger = logging.getLogger('parking_system')
-    logger.setLevel(logging.INFO)
+    # WARNING by default; set PARKING_LOG_LEVEL=INFO (or DEBUG) for per-operation tracing
+    log_level = logging.getLevelName(os.environ.get('PARKING_LOG_LEVEL', 'WARNING').upper())
+    if not isinstance(log_level, int):
+        # Unknown level names come back as "Level <name>"; don't crash on a typo
+        log_level = logging.WARNING
+    logger.setLevel(log_level)
 
     # Create logs directory if it doesn't exist
     log_dir = 'logs'
@@ -18,11 +23,11 @@ def setup_logger():
 
     # File handler with rotation (max 5MB per file, keep 3 backup files)
     file_handler = RotatingFileHandler(log_file, maxBytes=5 * 1024 * 1024, backupCount=3)
-    file_handler.setLevel(logging.INFO)
+    file_handler.setLevel(log_level)
 
     # Console handler
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(logging.INFO)
+    console_handler.setLevel(log_level)
 
     # Create simplified formatter with only date, time, function name, and message
     formatter = logging.Formatter('%(asctime)s - %(funcName)s - %(message)s')
@@ -39,238 +44,240 @@ def setup_logger():
 
 logger = None
 
+NS_PER_HOUR = 3_600_000_000_000
+
 
 class VehicleType(Enum):
     TwoWheeler = 1
     FourWheeler = 2
 
 
+# Enum members are singletons: bind them once and compare by identity
+TWO_WHEELER = VehicleType.TwoWheeler
+FOUR_WHEELER = VehicleType.FourWheeler
+
+
 class Vehicle:
+    __slots__ = ("vehicle_no", "vehicle_type")
+
     def __init__(self, vehicle_no: int, vehicle_type: VehicleType):
-        logger.info(f"Creating vehicle with number {vehicle_no} of type {vehicle_type.name}")
+        logger.debug("Creating vehicle with number %s of type %s", vehicle_no, vehicle_type.name)
         self.vehicle_no = vehicle_no
         self.vehicle_type = vehicle_type
 
 
 # Parking Spot
 class ParkingSpot:
+    __slots__ = ("id", "price", "vehicle")
+
     def __init__(self, spot_id: int, price: int):
-        logger.info(f"Creating parking spot with ID {spot_id} and price {price}")
+        logger.debug("Creating parking spot with ID %s and price %s", spot_id, price)
         self.id = spot_id
         self.price = price
         self.vehicle: Optional[Vehicle] = None
 
     def is_empty(self) -> bool:
-        logger.info(f"Checking if spot {self.id} is empty")
+        logger.debug("Checking if spot %s is empty", self.id)
         return self.vehicle is None
 
     def park_vehicle(self, vehicle: Vehicle):
-        logger.info(f"Parking vehicle {vehicle.vehicle_no} in spot {self.id}")
+        logger.debug("Parking vehicle %s in spot %s", vehicle.vehicle_no, self.id)
         self.vehicle = vehicle
 
     def remove_vehicle(self):
         if self.vehicle:
-            logger.info(f"Removing vehicle {self.vehicle.vehicle_no} from spot {self.id}")
+            logger.debug("Removing vehicle %s from spot %s", self.vehicle.vehicle_no, self.id)
         else:
-            logger.warning(f"Attempting to remove vehicle from empty spot {self.id}")
+            logger.warning("Attempting to remove vehicle from empty spot %s", self.id)
         self.vehicle = None
 
-    def __lt__(self, other):
-        # Add logging for comparisons
-        logger.debug(f"Comparing spot {self.id} with spot {other.id}")
-        return self.id < other.id
-
 
-# Abstract Spot Manager with heapq (Strategy + DI + Template pattern)
+# Spot Manager with heapq, one instance per vehicle type (Strategy + DI)
 class ParkingSpotManager:
-    def __init__(self, spots: List[ParkingSpot]):
-        logger.info(f"Initializing with {len(spots)} spots")
-        self.spot_heap = [spot for spot in spots if spot.is_empty()]
-        heapq.heapify(self.spot_heap)
+    def __init__(self, spots: List[ParkingSpot], kind: VehicleType):
+        logger.debug("Initializing %s manager with %s spots", kind.name, len(spots))
+        self.kind = kind
         self.spots = spots
-        logger.info(f"Initialized with {len(self.spot_heap)} available spots")
+        # Heap of (price, index into self.spots): cheapest open spot first, ties by position.
+        # Entries are plain int pairs, so sift comparisons never touch ParkingSpot objects.
+        self.spot_heap = [(spot.price, i) for i, spot in enumerate(spots) if spot.is_empty()]
+        heapq.heapify(self.spot_heap)
+        self._occupied: Dict[int, int] = {
+            spot.vehicle.vehicle_no: i for i, spot in enumerate(spots) if not spot.is_empty()
+        }
+        logger.debug("Initialized with %s available spots", len(self.spot_heap))
 
-    def find_parking_space(self) -> Optional[ParkingSpot]:
-        logger.info(f" finding parking space ...")
+    def _pop_free_index(self) -> Optional[int]:
         while self.spot_heap:
-            spot = heapq.heappop(self.spot_heap)
-            if spot.is_empty():
-                logger.info(f"found empty spot {spot.id}")
-                return spot
-        logger.warning(f"no parking spots available!")
+            _, index = heapq.heappop(self.spot_heap)
+            if self.spots[index].is_empty():
+                return index
         return None
 
+    def find_parking_space(self) -> Optional[ParkingSpot]:
+        logger.debug(" finding parking space ...")
+        index = self._pop_free_index()
+        if index is None:
+            logger.warning("no parking spots available!")
+            return None
+        spot = self.spots[index]
+        logger.debug("found empty spot %s", spot.id)
+        return spot
+
     def park_vehicle(self, vehicle: Vehicle) -> Optional[ParkingSpot]:
-        logger.info(f"Attempting to park vehicle {vehicle.vehicle_no}")
-        spot = self.find_parking_space()
-        if spot:
-            spot.park_vehicle(vehicle)
-            logger.info(f"Successfully parked vehicle {vehicle.vehicle_no} in spot {spot.id}")
-        else:
-            logger.warning(f"Failed to park vehicle {vehicle.vehicle_no}, no spots available")
+        logger.debug("Attempting to park vehicle %s", vehicle.vehicle_no)
+        index = self._pop_free_index()
+        if index is None:
+            logger.warning("Failed to park vehicle %s, no spots available", vehicle.vehicle_no)
+            return None
+        spot = self.spots[index]
+        spot.park_vehicle(vehicle)
+        self._occupied[vehicle.vehicle_no] = index
+        logger.debug("Successfully parked vehicle %s in spot %s", vehicle.vehicle_no, spot.id)
         return spot
 
     def remove_vehicle(self, vehicle: Vehicle):
-        logger.info(f"Removing vehicle {vehicle.vehicle_no}")
-        removed = False
-        for spot in self.spots:
-            if spot.vehicle and spot.vehicle.vehicle_no == vehicle.vehicle_no:
-                spot.remove_vehicle()
-                heapq.heappush(self.spot_heap, spot)
-                logger.info(f"Vehicle {vehicle.vehicle_no} removed from spot {spot.id}")
-                removed = True
-                break
-
-        if not removed:
-            logger.warning(f"Vehicle {vehicle.vehicle_no} not found in any spot")
-
-
-class TwoWheelerManager(ParkingSpotManager):
-    def __init__(self, spots: List[ParkingSpot]):
-        logger.info("Creating TwoWheelerManager")
-        super().__init__(spots)
-
-
-class FourWheelerManager(ParkingSpotManager):
-    def __init__(self, spots: List[ParkingSpot]):
-        logger.info("Creating FourWheelerManager")
-        super().__init__(spots)
+        logger.debug("Removing vehicle %s", vehicle.vehicle_no)
+        index = self._occupied.pop(vehicle.vehicle_no, None)
+        if index is None:
+            logger.warning("Vehicle %s not found in any spot", vehicle.vehicle_no)
+            return
+        spot = self.spots[index]
+        spot.remove_vehicle()
+        heapq.heappush(self.spot_heap, (spot.price, index))
+        logger.debug("Vehicle %s removed from spot %s", vehicle.vehicle_no, spot.id)
 
 
 # Factory pattern
 class ParkingSpotManagerFactory:
     def get_manager(self, vehicle_type: VehicleType, spots: List[ParkingSpot]) -> ParkingSpotManager:
-        logger.info(f"Factory creating manager for {vehicle_type.name}")
-        if vehicle_type == VehicleType.TwoWheeler:
-            return TwoWheelerManager(spots)
-        else:
-            return FourWheelerManager(spots)
+        logger.debug("Factory creating manager for %s", vehicle_type.name)
+        return ParkingSpotManager(spots, vehicle_type)
 
 
 # Ticket and Billing
 class Ticket:
+    __slots__ = ("vehicle", "parking_spot", "entry_ns", "exit_ns")
+
     def __init__(self, vehicle: Vehicle, parking_spot: ParkingSpot):
-        logger.info(f"Creating ticket for vehicle {vehicle.vehicle_no} at spot {parking_spot.id}")
+        logger.debug("Creating ticket for vehicle %s at spot %s", vehicle.vehicle_no, parking_spot.id)
         self.vehicle = vehicle
         self.parking_spot = parking_spot
-        self.entry_time = datetime.now()
-        self.exit_time: Optional[datetime] = None
-        logger.info(f"Ticket issued for vehicle {vehicle.vehicle_no} at {self.entry_time}")
+        # Monotonic integer nanoseconds: immune to clock changes, no datetime allocation
+        self.entry_ns = time.monotonic_ns()
+        self.exit_ns: Optional[int] = None
+        logger.debug("Ticket issued for vehicle %s", vehicle.vehicle_no)
 
     def close_ticket(self):
-        self.exit_time = datetime.now()
-        duration = self.exit_time - self.entry_time
-        hours = duration.total_seconds() / 3600
-        logger.info(f"Ticket closed for vehicle {self.vehicle.vehicle_no}. Duration: {hours:.2f} hours")
+        self.exit_ns = time.monotonic_ns()
+        logger.debug("Ticket closed for vehicle %s. Duration: %.2f hours",
+                     self.vehicle.vehicle_no, (self.exit_ns - self.entry_ns) / NS_PER_HOUR)
 
 
 class BillingService:
     def calculate_fees(self, ticket: Ticket) -> int:
-        logger.info(f"Calculating fees for vehicle {ticket.vehicle.vehicle_no}")
+        logger.debug("Calculating fees for vehicle %s", ticket.vehicle.vehicle_no)
         ticket.close_ticket()
-        duration_hours = max(1, int((ticket.exit_time - ticket.entry_time).total_seconds() // 3600))
+        duration_hours = max(1, (ticket.exit_ns - ticket.entry_ns) // NS_PER_HOUR)
         fees = duration_hours * ticket.parking_spot.price
-        logger.info(
-            f"Fees for vehicle {ticket.vehicle.vehicle_no}: {fees} (duration: {duration_hours} hours, rate: {ticket.parking_spot.price})")
+        logger.debug("Fees for vehicle %s: %s (duration: %s hours, rate: %s)",
+                     ticket.vehicle.vehicle_no, fees, duration_hours, ticket.parking_spot.price)
         return fees
 
 
 # Ticket Service
 class TicketService:
     def __init__(self):
-        logger.info("Initializing TicketService")
-        self.active_tickets = {}
+        logger.debug("Initializing TicketService")
+        # Keyed by vehicle_no, which must stay an int (never str(vehicle_no))
+        self.active_tickets: Dict[int, Ticket] = {}
 
     def generate_ticket(self, vehicle: Vehicle, spot: ParkingSpot) -> Ticket:
-        logger.info(f"Generating ticket for vehicle {vehicle.vehicle_no}")
+        logger.debug("Generating ticket for vehicle %s", vehicle.vehicle_no)
         ticket = Ticket(vehicle, spot)
         self.active_tickets[vehicle.vehicle_no] = ticket
-        logger.info(f"Active tickets count: {len(self.active_tickets)}")
         return ticket
 
     def close_ticket(self, vehicle_no: int) -> Optional[Ticket]:
-        logger.info(f"Closing ticket for vehicle {vehicle_no}")
+        logger.debug("Closing ticket for vehicle %s", vehicle_no)
         ticket = self.active_tickets.pop(vehicle_no, None)
         if ticket:
-            logger.info(f"Ticket found and closed for vehicle {vehicle_no}")
+            logger.debug("Ticket found and closed for vehicle %s", vehicle_no)
         else:
-            logger.warning(f"No active ticket found for vehicle {vehicle_no}")
-        logger.info(f"Remaining active tickets: {len(self.active_tickets)}")
+            logger.warning("No active ticket found for vehicle %s", vehicle_no)
         return ticket
 
 
 # Entrance and Exit Gate (uses DI)
 class EntranceGate:
-    def __init__(self, factory: ParkingSpotManagerFactory, ticket_service: TicketService):
-        logger.info("Initializing EntranceGate")
-        self.factory = factory
+    def __init__(self, ticket_service: TicketService):
+        logger.debug("Initializing EntranceGate")
         self.ticket_service = ticket_service
 
-    def allow_entry(self, vehicle: Vehicle, spots: List[ParkingSpot]) -> Optional[Ticket]:
-        logger.info(f"EntranceGate processing entry for vehicle {vehicle.vehicle_no}")
-        manager = self.factory.get_manager(vehicle.vehicle_type, spots)
+    def allow_entry(self, vehicle: Vehicle, manager: ParkingSpotManager) -> Optional[Ticket]:
+        logger.debug("EntranceGate processing entry for vehicle %s", vehicle.vehicle_no)
         spot = manager.park_vehicle(vehicle)
         if not spot:
-            logger.warning(f"EntranceGate denied entry to vehicle {vehicle.vehicle_no} - no spot available")
+            logger.warning("EntranceGate denied entry to vehicle %s - no spot available", vehicle.vehicle_no)
             return None
 
         ticket = self.ticket_service.generate_ticket(vehicle, spot)
-        logger.info(f"EntranceGate allowed entry to vehicle {vehicle.vehicle_no} at spot {spot.id}")
+        logger.debug("EntranceGate allowed entry to vehicle %s at spot %s", vehicle.vehicle_no, spot.id)
         return ticket
 
 
 class ExitGate:
-    def __init__(self, factory: ParkingSpotManagerFactory, billing_service: BillingService,
-                 ticket_service: TicketService):
-        logger.info("Initializing ExitGate")
-        self.factory = factory
+    def __init__(self, billing_service: BillingService, ticket_service: TicketService):
+        logger.debug("Initializing ExitGate")
         self.billing_service = billing_service
         self.ticket_service = ticket_service
 
-    def process_exit(self, vehicle: Vehicle, spots: List[ParkingSpot]) -> Optional[int]:
-        logger.info(f"ExitGate processing exit for vehicle {vehicle.vehicle_no}")
+    def process_exit(self, vehicle: Vehicle, manager: ParkingSpotManager) -> Optional[int]:
+        logger.debug("ExitGate processing exit for vehicle %s", vehicle.vehicle_no)
         ticket = self.ticket_service.close_ticket(vehicle.vehicle_no)
         if not ticket:
-            logger.warning(f"ExitGate denied exit to vehicle {vehicle.vehicle_no} - no active ticket found")
+            logger.warning("ExitGate denied exit to vehicle %s - no active ticket found", vehicle.vehicle_no)
             return None
 
-        manager = self.factory.get_manager(vehicle.vehicle_type, spots)
         manager.remove_vehicle(vehicle)
 
         fees = self.billing_service.calculate_fees(ticket)
-        logger.info(f"ExitGate allowed exit to vehicle {vehicle.vehicle_no} with fees {fees}")
+        logger.debug("ExitGate allowed exit to vehicle %s with fees %s", vehicle.vehicle_no, fees)
         return fees
 
 
 # Parking Lot Aggregator (Facade pattern)
 class ParkingLot:
     def __init__(self, two_wheeler_spots: List[ParkingSpot], four_wheeler_spots: List[ParkingSpot]):
-        logger.info(
-            f"Initializing ParkingLot with {len(two_wheeler_spots)} two-wheeler spots and {len(four_wheeler_spots)} four-wheeler spots")
+        logger.debug("Initializing ParkingLot with %s two-wheeler spots and %s four-wheeler spots",
+                     len(two_wheeler_spots), len(four_wheeler_spots))
         self.two_wheeler_spots = two_wheeler_spots
         self.four_wheeler_spots = four_wheeler_spots
         self.factory = ParkingSpotManagerFactory()
+        # Managers are built once so their heaps keep occupancy across entries/exits
+        self.two_wheeler_manager = self.factory.get_manager(TWO_WHEELER, two_wheeler_spots)
+        self.four_wheeler_manager = self.factory.get_manager(FOUR_WHEELER, four_wheeler_spots)
         self.ticket_service = TicketService()
         self.billing_service = BillingService()
-        self.entrance_gate = EntranceGate(self.factory, self.ticket_service)
-        self.exit_gate = ExitGate(self.factory, self.billing_service, self.ticket_service)
-        logger.info("ParkingLot system initialized and ready")
+        self.entrance_gate = EntranceGate(self.ticket_service)
+        self.exit_gate = ExitGate(self.billing_service, self.ticket_service)
+        logger.debug("ParkingLot system initialized and ready")
 
     def park_vehicle(self, vehicle: Vehicle) -> Optional[Ticket]:
-        logger.info(f"ParkingLot processing parking request for vehicle {vehicle.vehicle_no}")
-        if vehicle.vehicle_type == VehicleType.TwoWheeler:
-            logger.info(f"Routing two-wheeler {vehicle.vehicle_no} to two-wheeler spots")
-            return self.entrance_gate.allow_entry(vehicle, self.two_wheeler_spots)
-        logger.info(f"Routing four-wheeler {vehicle.vehicle_no} to four-wheeler spots")
-        return self.entrance_gate.allow_entry(vehicle, self.four_wheeler_spots)
+        logger.debug("ParkingLot processing parking request for vehicle %s", vehicle.vehicle_no)
+        if vehicle.vehicle_type is TWO_WHEELER:
+            logger.debug("Routing two-wheeler %s to two-wheeler spots", vehicle.vehicle_no)
+            return self.entrance_gate.allow_entry(vehicle, self.two_wheeler_manager)
+        logger.debug("Routing four-wheeler %s to four-wheeler spots", vehicle.vehicle_no)
+        return self.entrance_gate.allow_entry(vehicle, self.four_wheeler_manager)
 
     def release_vehicle(self, vehicle: Vehicle) -> Optional[int]:
-        logger.info(f"ParkingLot processing exit request for vehicle {vehicle.vehicle_no}")
-        if vehicle.vehicle_type == VehicleType.TwoWheeler:
-            logger.info(f"Processing two-wheeler {vehicle.vehicle_no} exit")
-            return self.exit_gate.process_exit(vehicle, self.two_wheeler_spots)
-        logger.info(f"Processing four-wheeler {vehicle.vehicle_no} exit")
-        return self.exit_gate.process_exit(vehicle, self.four_wheeler_spots)
+        logger.debug("ParkingLot processing exit request for vehicle %s", vehicle.vehicle_no)
+        if vehicle.vehicle_type is TWO_WHEELER:
+            logger.debug("Processing two-wheeler %s exit", vehicle.vehicle_no)
+            return self.exit_gate.process_exit(vehicle, self.two_wheeler_manager)
+        logger.debug("Processing four-wheeler %s exit", vehicle.vehicle_no)
+        return self.exit_gate.process_exit(vehicle, self.four_wheeler_manager)
 
 
 # Example Usage
@@ -296,15 +303,13 @@ if __name__ == "__main__":
     ticket2 = lot.park_vehicle(v2)
 
     logger.info("Simulating time passing")
-    import time
-
     time.sleep(2)
 
     logger.info("Testing vehicle release")
     fees1 = lot.release_vehicle(v1)
     fees2 = lot.release_vehicle(v2)
 
-    logger.info(f"Vehicle 101 fees: {fees1}")
-    logger.info(f"Vehicle 202 fees: {fees2}")
+    print(f"Vehicle 101 fees: {fees1}")
+    print(f"Vehicle 202 fees: {fees2}")
 
     logger.info("Application test completed")
\ No newline at end of file
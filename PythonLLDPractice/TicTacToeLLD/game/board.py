@@ -1,5 +1,6 @@
 # game/board.py
 
+from PythonLLDPractice.TicTacToeLLD.game.enums import PieceType
 from PythonLLDPractice.TicTacToeLLD.game.playing_piece import PlayingPiece
 from PythonLLDPractice.TicTacToeLLD.utils.logger import *
 
@@ -8,19 +9,57 @@ class Board:
     def __init__(self, size=3):
         self.size = size
         self.grid = [[None for _ in range(size)] for _ in range(size)]
+        # One bit per cell (bit row*size+col) for each player's occupied cells
+        self.x_mask = 0
+        self.o_mask = 0
+        self._full_mask = (1 << (size * size)) - 1
+        self._lines = self._build_win_lines(size)
+        # Piece types that completed a line; updated incrementally by add_piece
+        self._winners = set()
         log_info(f"Board initialized with size {size}x{size}")
 
     def add_piece(self, row: int, col: int, piece: PlayingPiece):
         """Adds a piece to the board if the move is valid."""
         if self.is_valid_move(row, col):
             self.grid[row][col] = piece
-            log_info(f"Piece {piece.get_piece_type().value} added at ({row}, {col})")
+            piece_type = piece.piece_type
+            bit = 1 << (row * self.size + col)
+            if piece_type is PieceType.X:
+                self.x_mask |= bit
+                mask = self.x_mask
+            else:
+                self.o_mask |= bit
+                mask = self.o_mask
+            if self._completes_line(row, col, mask):
+                self._winners.add(piece_type)
+            log_info(f"Piece {piece.piece_type.value} added at ({row}, {col})")
             return True
         else:
             log_error(f"Invalid Move at ({row}, {col})")
             print("Invalid Move! Try again.")
             return False
 
+    @staticmethod
+    def _build_win_lines(size: int):
+        """Precomputes the bitmask of every row, column and both diagonals."""
+        row = (1 << size) - 1
+        col = sum(1 << (r * size) for r in range(size))
+        lines = [row << (r * size) for r in range(size)]
+        lines += [col << c for c in range(size)]
+        lines.append(sum(1 << (i * size + i) for i in range(size)))
+        lines.append(sum(1 << (i * size + size - i - 1) for i in range(size)))
+        return tuple(lines)
+
+    def _completes_line(self, row: int, col: int, mask: int):
+        """Checks only the lines through (row, col): at most a row, a column and two diagonals."""
+        n = self.size
+        lines = self._lines
+        if (mask & lines[row]) == lines[row] or (mask & lines[n + col]) == lines[n + col]:
+            return True
+        if row == col and (mask & lines[2 * n]) == lines[2 * n]:
+            return True
+        return row + col == n - 1 and (mask & lines[2 * n + 1]) == lines[2 * n + 1]
+
     def is_valid_move(self, row: int, col: int):
         """Checks if the move is valid (inside bounds and empty)."""
         return 0 <= row < self.size and 0 <= col < self.size and self.grid[row][col] is None
@@ -28,31 +67,13 @@ class Board:
     def print_board(self):
         """Displays the current state of the board."""
         for row in self.grid:
-            print("|".join([p.get_piece_type().value if p else " " for p in row]))
+            print("|".join([p.piece_type.value if p else " " for p in row]))
             print("-" * (self.size * 2 - 1))
 
     def is_winner(self, piece: PlayingPiece):
         """Checks if the given piece has a winning line on the board."""
-        piece_type = piece.get_piece_type()
-
-        # Check rows
-        for row in self.grid:
-            if all(cell and cell.get_piece_type() == piece_type for cell in row):
-                return True
-
-        # Check columns
-        for col in range(self.size):
-            if all(self.grid[row][col] and self.grid[row][col].get_piece_type() == piece_type for row in range(self.size)):
-                return True
-
-        # Check diagonals
-        if all(self.grid[i][i] and self.grid[i][i].get_piece_type() == piece_type for i in range(self.size)):
-            return True
-        if all(self.grid[i][self.size - i - 1] and self.grid[i][self.size - i - 1].get_piece_type() == piece_type for i in range(self.size)):
-            return True
-
-        return False
+        return piece.piece_type in self._winners
 
     def is_full(self):
         """Checks if the board is full (draw condition)."""
-        return all(cell is not None for row in self.grid for cell in row)
+        return (self.x_mask | self.o_mask) == self._full_mask
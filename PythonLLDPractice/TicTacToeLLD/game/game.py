@@ -2,7 +2,7 @@
 
 from .board import Board
 from .player import Player
-from .playing_piece import PlayingPieceX, PlayingPieceO
+from .playing_piece import X_PIECE, O_PIECE
 from PythonLLDPractice.TicTacToeLLD.utils.logger import *
 
 class TicTacToeGame:
@@ -10,8 +10,8 @@ class TicTacToeGame:
     def __init__(self):
         self.board = Board()
         self.players = [
-            Player("Player 1", PlayingPieceX()),
-            Player("Player 2", PlayingPieceO())
+            Player("Player 1", X_PIECE),
+            Player("Player 2", O_PIECE)
         ]
         self.current_turn = 0
         log_info("Game initialized with Player 1 (X) and Player 2 (O)")
@@ -19,7 +19,7 @@ class TicTacToeGame:
     def switch_turn(self):
         """Switches the turn to the next player."""
         self.current_turn = 1 - self.current_turn
-        log_info(f"Turn switched to {self.players[self.current_turn].get_name()}")
+        log_info(f"Turn switched to {self.players[self.current_turn].name}")
 
     def start_game(self):
         """Starts the game loop."""
@@ -29,7 +29,7 @@ class TicTacToeGame:
 
         while True:
             current_player = self.players[self.current_turn]
-            print(f"{current_player.get_name()}'s turn ({current_player.get_playing_piece().get_piece_type().value})")
+            print(f"{current_player.name}'s turn ({current_player.piece.piece_type.value})")
 
             try:
                 row, col = map(int, input("Enter row and column (0, 1, 2): ").split())
@@ -37,12 +37,12 @@ class TicTacToeGame:
                 print("Invalid input! Please enter two integers.")
                 continue
 
-            if self.board.add_piece(row, col, current_player.get_playing_piece()):
+            if self.board.add_piece(row, col, current_player.piece):
                 self.board.print_board()
 
-                if self.board.is_winner(current_player.get_playing_piece()):
-                    print(f"{current_player.get_name()} wins!")
-                    log_info(f"{current_player.get_name()} wins the game!")
+                if self.board.is_winner(current_player.piece):
+                    print(f"{current_player.name} wins!")
+                    log_info(f"{current_player.name} wins the game!")
                     break
                 elif self.board.is_full():
                     print("Game is a Draw!")
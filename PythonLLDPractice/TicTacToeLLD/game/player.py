@@ -6,9 +6,3 @@ class Player:
     def __init__(self, name: str, piece: PlayingPiece):
         self.name = name
         self.piece = piece
-
-    def get_playing_piece(self):
-        return self.piece
-
-    def get_name(self):
-        return self.name
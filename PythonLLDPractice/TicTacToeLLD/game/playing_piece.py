@@ -3,20 +3,46 @@ from .enums import PieceType
 
 class PlayingPiece:
     """Base class representing a playing piece on the board."""
+    __slots__ = ("piece_type",)
+
     def __init__(self, piece_type: PieceType):
         self.piece_type = piece_type
 
-    def get_piece_type(self):
-        return self.piece_type
+    @classmethod
+    def of(cls, piece_type: PieceType) -> "PlayingPiece":
+        """Returns the shared piece instance for the given type."""
+        return _PIECES[piece_type]
+
+
+class _SingletonPiece(PlayingPiece):
+    """Pieces are immutable tags, so each concrete class has a single instance."""
+    __slots__ = ()
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+        return cls._instance
 
 
-class PlayingPieceX(PlayingPiece):
+class PlayingPieceX(_SingletonPiece):
     """Concrete class representing an 'X' piece."""
+    __slots__ = ()
+    _instance = None
+
     def __init__(self):
         super().__init__(PieceType.X)
 
 
-class PlayingPieceO(PlayingPiece):
+class PlayingPieceO(_SingletonPiece):
     """Concrete class representing an 'O' piece."""
+    __slots__ = ()
+    _instance = None
+
     def __init__(self):
         super().__init__(PieceType.O)
+
+
+X_PIECE = PlayingPieceX()
+O_PIECE = PlayingPieceO()
+_PIECES = {PieceType.X: X_PIECE, PieceType.O: O_PIECE}
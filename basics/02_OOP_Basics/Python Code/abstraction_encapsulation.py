@@ -4,11 +4,17 @@ ABSTRACTION & ENCAPSULATION IN PYTHON
 
 Abstraction: Hiding implementation details and showing only essential features.
 Encapsulation: Bundling data and methods together, restricting direct access.
+
+Runtime: tested on CPython only. DataProcessor and CachedProperty are plain
+Python and should suit PyPy, but FastABC relies on CPython's object.__new__
+honouring __abstractmethods__; on other runtimes, use abc.ABC instead.
 """
 
-from abc import ABC, abstractmethod
-from typing import Protocol, runtime_checkable
+from abc import abstractmethod
+from typing import Any, Callable, Dict, List, Optional, Protocol, Tuple, runtime_checkable
 import functools
+import operator
+import sys
 
 
 # ============================================================================
@@ -25,29 +31,38 @@ class BankAccount:
     - private: __double_underscore (name mangling applied)
     """
 
-    def __init__(self, account_number: str, balance: float):
+    # Slot names are mangled too: '__balance' becomes '_BankAccount__balance'
+    __slots__ = ('account_number', '_account_type', '__balance', '_on_transaction')
+
+    def __init__(self, account_number: str, balance: float,
+                 on_transaction: Optional[Callable[[str], None]] = None):
         """
         Initialize a bank account.
 
         Args:
             account_number: Public account identifier
             balance: Initial account balance
+            on_transaction: Optional callback receiving a log line per
+                transaction (e.g. print); None disables logging
         """
         self.account_number = account_number  # Public
         self._account_type = "savings"  # Protected (convention)
         self.__balance = balance  # Private (name mangled)
+        self._on_transaction = on_transaction
 
     def deposit(self, amount: float) -> None:
         """Public method to deposit money."""
         if amount > 0:
             self.__balance += amount
-            self.__log_transaction("deposit", amount)
+            if self._on_transaction is not None:
+                self.__log_transaction("deposit", amount)
 
     def withdraw(self, amount: float) -> bool:
         """Public method to withdraw money."""
         if self.__validate_withdrawal(amount):
             self.__balance -= amount
-            self.__log_transaction("withdrawal", amount)
+            if self._on_transaction is not None:
+                self.__log_transaction("withdrawal", amount)
             return True
         return False
 
@@ -64,8 +79,39 @@ class BankAccount:
         return amount > 0 and amount <= self.__balance
 
     def __log_transaction(self, transaction_type: str, amount: float) -> None:
-        """Private method to log transactions."""
-        print(f"{transaction_type.title()}: ${amount:.2f}")
+        """Private method to log transactions through the callback."""
+        self._on_transaction(_TRANSACTION_LOG_FORMAT % (_TRANSACTION_LABELS[transaction_type], amount))
+
+
+# Precomputed label per transaction type (avoids str.title() per log line)
+_TRANSACTION_LABELS = {"deposit": "Deposit", "withdrawal": "Withdrawal"}
+_TRANSACTION_LOG_FORMAT = "%s: $%.2f"
+
+
+class TransactionLogBuffer:
+    """
+    Transaction log sink that batches lines before writing to stdout.
+
+    Pass an instance as BankAccount(on_transaction=...); call flush()
+    when done so the last partial batch is written.
+    """
+
+    __slots__ = ('_lines', '_batch_size')
+
+    def __init__(self, batch_size: int = 100):
+        self._lines: List[str] = []
+        self._batch_size = batch_size
+
+    def __call__(self, line: str) -> None:
+        self._lines.append(line)
+        if len(self._lines) >= self._batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered lines with a single stdout write."""
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            self._lines.clear()
 
 
 # ============================================================================
@@ -78,11 +124,17 @@ class Temperature:
 
     Properties allow controlled access to attributes while maintaining
     a clean, Pythonic interface (no Java-style getCelsius/setCelsius).
+
+    Fahrenheit is derived once per write and cached, so reads are a plain
+    attribute load.
     """
 
+    __slots__ = ('_celsius', '_fahrenheit_cache')
+
     def __init__(self, celsius: float = 0):
         """Initialize temperature in Celsius."""
         self._celsius = celsius
+        self._fahrenheit_cache = (celsius * 9 / 5) + 32
 
     @property
     def celsius(self) -> float:
@@ -103,16 +155,21 @@ class Temperature:
         if value < -273.15:
             raise ValueError("Temperature below absolute zero!")
         self._celsius = value
+        self._fahrenheit_cache = (value * 9 / 5) + 32
 
     @property
     def fahrenheit(self) -> float:
-        """Computed property - converts Celsius to Fahrenheit."""
-        return (self._celsius * 9 / 5) + 32
+        """Computed property - Celsius converted to Fahrenheit, cached by the setters."""
+        return self._fahrenheit_cache
 
     @fahrenheit.setter
     def fahrenheit(self, value: float) -> None:
         """Setter that converts Fahrenheit to Celsius."""
-        self.celsius = (value - 32) * 5 / 9
+        celsius = (value - 32) * 5 / 9
+        if celsius < -273.15:
+            raise ValueError("Temperature below absolute zero!")
+        self._celsius = celsius
+        self._fahrenheit_cache = value
 
     @celsius.deleter
     def celsius(self) -> None:
@@ -123,15 +180,41 @@ class Temperature:
         """
         print("Deleting temperature data")
         del self._celsius
+        del self._fahrenheit_cache
 
 
 # ============================================================================
 # PART 3: ABSTRACT BASE CLASSES (ABC)
 # ============================================================================
 
-class Animal(ABC):
+class FastABC:
+    """
+    Lightweight alternative to abc.ABC without the ABCMeta metaclass.
+
+    @abstractmethod only marks a function with __isabstractmethod__ = True.
+    Collecting the still-abstract names into __abstractmethods__ is enough
+    for object.__new__ to refuse instantiation, while isinstance() stays a
+    plain type check (no _abc_subclasscheck, no register() support).
+    That refusal is CPython behaviour and is unverified on PyPy.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        """Compute the abstract methods once, when the subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        abstracts = {name for name, value in vars(cls).items()
+                     if getattr(value, "__isabstractmethod__", False)}
+        for base in cls.__bases__:
+            for name in getattr(base, "__abstractmethods__", ()):
+                if getattr(getattr(cls, name, None), "__isabstractmethod__", False):
+                    abstracts.add(name)
+        cls.__abstractmethods__ = frozenset(abstracts)
+
+
+class Animal(FastABC):
     """
-    Abstract base class using abc.ABC.
+    Abstract base class using FastABC.
 
     Cannot be instantiated directly. Subclasses MUST implement
     all @abstractmethod decorated methods.
@@ -194,9 +277,11 @@ class Bird(Animal):
 # PART 4: ABSTRACT PROPERTIES
 # ============================================================================
 
-class Shape(ABC):
+class Shape(FastABC):
     """Demonstrates abstract properties."""
 
+    __slots__ = ()
+
     @property
     @abstractmethod
     def area(self) -> float:
@@ -215,21 +300,22 @@ class Shape(ABC):
 
 
 class Rectangle(Shape):
-    """Concrete shape implementing abstract properties."""
+    """
+    Concrete shape implementing abstract properties.
+
+    The dimensions are fixed at construction, so area and perimeter are
+    computed once and stored in slots. The slot descriptors replace the
+    abstract properties, which satisfies the Shape contract without a
+    property call on each read.
+    """
+
+    __slots__ = ('_width', '_height', 'area', 'perimeter')
 
     def __init__(self, width: float, height: float):
         self._width = width
         self._height = height
-
-    @property
-    def area(self) -> float:
-        """Implement abstract property."""
-        return self._width * self._height
-
-    @property
-    def perimeter(self) -> float:
-        """Implement abstract property."""
-        return 2 * (self._width + self._height)
+        self.area = width * height
+        self.perimeter = 2 * (width + height)
 
 
 # ============================================================================
@@ -312,7 +398,7 @@ class ValidatedString:
 
         Automatically gets the attribute name.
         """
-        self.name = f"_{name}"
+        self.name = sys.intern(f"_{name}")
 
     def __get__(self, obj, objtype=None):
         """
@@ -334,13 +420,14 @@ class ValidatedString:
             obj: Instance of the class
             value: Value being set
         """
-        if not isinstance(value, str):
+        if type(value) is not str:  # exact str only; str subclasses are rejected
             raise TypeError(f"Expected string, got {type(value).__name__}")
-        if len(value) < self.min_length:
+        length = len(value)
+        if length < self.min_length:
             raise ValueError(f"String too short (min: {self.min_length})")
-        if len(value) > self.max_length:
+        if length > self.max_length:
             raise ValueError(f"String too long (max: {self.max_length})")
-        setattr(obj, self.name, value)
+        obj.__dict__[self.name] = value
 
 
 class Person:
@@ -404,6 +491,34 @@ class MathOperations:
 # PART 8: CUSTOM PROPERTY DECORATOR
 # ============================================================================
 
+class CachedProperty:
+    """
+    Non-data descriptor that caches the computed value on the instance.
+
+    It defines __get__ but no __set__, so once the value is stored in the
+    instance __dict__ under the same name, normal attribute lookup finds it
+    there and never calls __get__ again (the functools.cached_property trick).
+    """
+
+    def __init__(self, func):
+        self.func = func
+        self.attrname = sys.intern(func.__name__)
+        functools.update_wrapper(self, func)
+
+    def __set_name__(self, owner, name):
+        """Record the attribute name the descriptor is bound to."""
+        # Interned so the instance-dict store/lookup can match keys by identity
+        self.attrname = sys.intern(name)
+
+    def __get__(self, obj, objtype=None):
+        """Compute once, then let the instance dict shadow the descriptor."""
+        if obj is None:
+            return self
+        value = self.func(obj)
+        obj.__dict__[self.attrname] = value
+        return value
+
+
 def cached_property(func):
     """
     Custom decorator creating a cached property.
@@ -411,16 +526,7 @@ def cached_property(func):
     Demonstrates how decorators enable encapsulation patterns.
     Computes value once and caches it.
     """
-    attr_name = f"_cached_{func.__name__}"
-
-    @functools.wraps(func)
-    def wrapper(self):
-        """Wrapper function that caches result."""
-        if not hasattr(self, attr_name):
-            setattr(self, attr_name, func(self))
-        return getattr(self, attr_name)
-
-    return property(wrapper)
+    return CachedProperty(func)
 
 
 class DataProcessor:
@@ -457,8 +563,77 @@ class LoggerMixin:
         print(f"[{level}] {self.__class__.__name__}: {message}")
 
 
+def _declared_fields(cls, annotations: bool = True) -> Tuple[str, ...]:
+    """Public field names declared via __slots__ (and annotations), base classes first."""
+    names: Dict[str, None] = {}
+    for klass in reversed(cls.__mro__):
+        slots = klass.__dict__.get('__slots__', ())
+        if isinstance(slots, str):
+            slots = (slots,)
+        declared = klass.__dict__.get('__annotations__', {}) if annotations else ()
+        for name in (*slots, *declared):
+            if not name.startswith('_'):
+                names[name] = None
+    return tuple(names)
+
+
+def _is_fully_slotted(cls) -> bool:
+    """True when every class in the MRO defines __slots__, so instances have no __dict__."""
+    return all('__slots__' in vars(klass) for klass in cls.__mro__ if klass is not object)
+
+
+def _make_to_dict(fields: Tuple[str, ...], uses_dict: bool) -> Callable[[Any], dict]:
+    """Build a to_dict that reads a fixed set of fields in one C-level call."""
+    get_values = operator.attrgetter(*fields)
+    if len(fields) == 1:
+        get_values = lambda obj, _get=get_values: (_get(obj),)
+    missing = object()
+
+    def to_dict(self) -> dict:
+        """Convert public fields to dictionary, skipping unset ones."""
+        try:
+            data = dict(zip(fields, get_values(self)))
+        except AttributeError:
+            data = {name: value for name in fields
+                    if (value := getattr(self, name, missing)) is not missing}
+        if uses_dict:
+            data.update((k, v) for k, v in self.__dict__.items()
+                        if not k.startswith('_'))
+        return data
+
+    # Marks it as replaceable when a subclass declares more fields
+    to_dict._generated = True
+    return to_dict
+
+
 class SerializableMixin:
-    """Mixin providing serialization."""
+    """
+    Mixin providing serialization.
+
+    Subclasses with declared fields get a to_dict specialised once at class
+    creation. Fully slotted classes (every class in the MRO defines
+    __slots__) read their slot and annotated fields; any other class reads
+    its slot fields and then merges the public entries of the instance
+    __dict__, so attributes a subclass adds are never lost.
+    """
+
+    __slots__ = ()
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        # Only replace the default or a generated to_dict, never a hand-written one
+        inherited = cls.to_dict
+        if not (inherited is SerializableMixin.to_dict
+                or getattr(inherited, '_generated', False)):
+            return
+        slotted = _is_fully_slotted(cls)
+        # Annotated names on a __dict__ class may be class defaults; the
+        # __dict__ filter picks up the ones actually set on the instance
+        fields = _declared_fields(cls, annotations=slotted)
+        if fields:
+            cls.to_dict = _make_to_dict(fields, uses_dict=not slotted)
+        else:
+            cls.to_dict = SerializableMixin.to_dict
 
     def to_dict(self) -> dict:
         """Convert public attributes to dictionary."""
@@ -473,6 +648,9 @@ class User(LoggerMixin, SerializableMixin):
     Gains logging and serialization without deep inheritance.
     """
 
+    username: str
+    email: str
+
     def __init__(self, username: str, email: str):
         self.username = username
         self.email = email
@@ -483,7 +661,7 @@ class User(LoggerMixin, SerializableMixin):
 # PART 10: INTERFACE SEGREGATION WITH ABC
 # ============================================================================
 
-class Readable(ABC):
+class Readable(FastABC):
     """Small, focused interface for reading."""
 
     @abstractmethod
@@ -491,7 +669,7 @@ class Readable(ABC):
         pass
 
 
-class Writable(ABC):
+class Writable(FastABC):
     """Small, focused interface for writing."""
 
     @abstractmethod
@@ -509,15 +687,20 @@ class File(Readable, Writable):
 
     def __init__(self, filename: str):
         self.filename = filename
-        self._content = ""
+        # UTF-8 bytes in a growable buffer, so appends extend in place
+        self._content = bytearray()
 
     def read(self) -> str:
         """Implement Readable interface."""
-        return self._content
+        return self._content.decode('utf-8')
 
     def write(self, data: str) -> None:
-        """Implement Writable interface."""
-        self._content = data
+        """Implement Writable interface (replaces the content)."""
+        self._content[:] = data.encode('utf-8')
+
+    def append(self, data: str) -> None:
+        """Add data to the end without copying the existing content."""
+        self._content += data.encode('utf-8')
 
 
 # ============================================================================
@@ -526,8 +709,10 @@ class File(Readable, Writable):
 
 if __name__ == "__main__":
     print("=== ENCAPSULATION DEMO ===")
-    account = BankAccount("ACC123", 1000)
+    transaction_log = TransactionLogBuffer()
+    account = BankAccount("ACC123", 1000, on_transaction=transaction_log)
     account.deposit(500)
+    transaction_log.flush()
     print(f"Balance: ${account.get_balance()}")
 
     print("\n=== PROPERTY DEMO ===")
@@ -10,11 +10,24 @@ Benefits:
 - Simplifies testing and debugging
 - Allows parallel development
 - Reduces complexity
+
+Runtime: written to stay friendly to PyPy's JIT for the hot loops here
+(process_order_good, merge_sort) by sticking to plain classes, integer
+timestamps and direct attribute access. Only CPython has been tested;
+PyPy support is intended but unverified.
 """
 
+from collections import OrderedDict
+from functools import lru_cache
+from operator import itemgetter, mul
 from typing import List, Dict, Tuple
-from dataclasses import dataclass
 from datetime import datetime
+import hashlib
+import hmac
+import itertools
+import os
+import re
+import time
 
 
 # ============================================================================
@@ -71,13 +84,16 @@ def validate_order(order_data: dict) -> Tuple[bool, str]:
     Returns:
         Tuple of (is_valid, error_message)
     """
-    if not order_data.get('items'):
+    items = order_data.get('items')
+    if not items:
         return False, 'No items in order'
 
-    for item in order_data['items']:
-        if item.get('quantity', 0) <= 0:
+    # Stops at the first bad item; binds item.get once per item
+    for item in items:
+        get = item.get
+        if get('quantity', 0) <= 0:
             return False, 'Invalid quantity for item'
-        if item.get('price', 0) < 0:
+        if get('price', 0) < 0:
             return False, 'Invalid price for item'
 
     return True, ''
@@ -93,7 +109,8 @@ def calculate_subtotal(items: List[dict]) -> float:
     Returns:
         Subtotal amount
     """
-    return sum(item['price'] * item['quantity'] for item in items)
+    # map/itemgetter keep the whole reduction in C, without a generator frame per item
+    return sum(map(mul, map(itemgetter('price'), items), map(itemgetter('quantity'), items)))
 
 
 def calculate_tax(subtotal: float, tax_rate: float = 0.08) -> float:
@@ -124,6 +141,14 @@ def calculate_shipping(subtotal: float, free_shipping_threshold: float = 50) ->
     return 0 if subtotal >= free_shipping_threshold else 10
 
 
+# Discount table for apply_discount, built once at import time
+_DISCOUNTS = {
+    'SAVE10': 0.10,
+    'SAVE20': 0.20,
+    'SUMMER': 0.15
+}
+
+
 def apply_discount(total: float, coupon_code: str) -> float:
     """
     Single responsibility: Apply discount coupon.
@@ -133,16 +158,15 @@ def apply_discount(total: float, coupon_code: str) -> float:
         coupon_code: Coupon code to apply
 
     Returns:
-        Discounted total
+        Discounted total (unchanged for unknown codes)
     """
-    discounts = {
-        'SAVE10': 0.10,
-        'SAVE20': 0.20,
-        'SUMMER': 0.15
-    }
+    discount_rate = _DISCOUNTS.get(coupon_code)
+    return total if discount_rate is None else total * (1 - discount_rate)
 
-    discount_rate = discounts.get(coupon_code, 0)
-    return total * (1 - discount_rate)
+
+# Order numbers count up from the start-up time in milliseconds: one clock
+# read per process, and IDs stay unique even within the same millisecond
+_order_ids = itertools.count(time.time_ns() // 1_000_000)
 
 
 def generate_order_id() -> str:
@@ -152,8 +176,7 @@ def generate_order_id() -> str:
     Returns:
         Unique order identifier
     """
-    timestamp = int(datetime.now().timestamp() * 1000)
-    return f"ORD-{timestamp}"
+    return f"ORD-{next(_order_ids)}"
 
 
 def process_order_good(order_data: dict) -> dict:
@@ -178,13 +201,13 @@ def process_order_good(order_data: dict) -> dict:
     if coupon := order_data.get('coupon'):
         total = apply_discount(total, coupon)
 
-    # Return formatted result
+    # Return raw amounts; round only when formatting for display
     return {
         'order_id': generate_order_id(),
-        'subtotal': round(subtotal, 2),
-        'tax': round(tax, 2),
-        'shipping': round(shipping, 2),
-        'total': round(total, 2)
+        'subtotal': subtotal,
+        'tax': tax,
+        'shipping': shipping,
+        'total': total
     }
 
 
@@ -192,20 +215,41 @@ def process_order_good(order_data: dict) -> dict:
 # PART 2: CLASS-BASED DECOMPOSITION
 # ============================================================================
 
-@dataclass
 class Item:
     """
     Decomposed data structure for an item.
 
     Encapsulates item-related data and behavior.
+    Uses __slots__ (no per-instance __dict__) and computes the line
+    total once; price and quantity are read-only so it cannot go stale.
     """
-    name: str
-    price: float
-    quantity: int
+    __slots__ = ('name', '_price', '_quantity', '_total')
+
+    def __init__(self, name: str, price: float, quantity: int):
+        self.name = name
+        self._price = price
+        self._quantity = quantity
+        self._total = price * quantity
+
+    @property
+    def price(self) -> float:
+        return self._price
+
+    @property
+    def quantity(self) -> int:
+        return self._quantity
+
+    def __repr__(self) -> str:
+        return f"Item(name={self.name!r}, price={self.price!r}, quantity={self.quantity!r})"
+
+    def __eq__(self, other) -> bool:
+        if other.__class__ is not self.__class__:
+            return NotImplemented
+        return (self.name, self.price, self.quantity) == (other.name, other.price, other.quantity)
 
     def get_total(self) -> float:
-        """Calculate total for this item."""
-        return self.price * self.quantity
+        """Return the precomputed total for this item."""
+        return self._total
 
     def is_valid(self) -> bool:
         """Validate item data."""
@@ -217,28 +261,38 @@ class ShoppingCart:
     Decomposed class handling cart operations.
 
     Separates cart logic from order processing.
+    Items change only through add_item/remove_item, which keep the
+    running subtotal in step.
     """
 
     def __init__(self):
         """Initialize empty cart."""
-        self.items: List[Item] = []
+        self._items: List[Item] = []
+        self._subtotal = 0
+
+    @property
+    def items(self) -> Tuple[Item, ...]:
+        """Read-only snapshot of the cart's items."""
+        return tuple(self._items)
 
     def add_item(self, item: Item) -> None:
         """Add item to cart."""
         if item.is_valid():
-            self.items.append(item)
+            self._items.append(item)
+            self._subtotal += item._total
 
     def remove_item(self, item_name: str) -> None:
         """Remove item from cart by name."""
-        self.items = [item for item in self.items if item.name != item_name]
+        self._items = [item for item in self._items if item.name != item_name]
+        self._subtotal = sum(item._total for item in self._items)
 
     def get_subtotal(self) -> float:
-        """Calculate cart subtotal."""
-        return sum(item.get_total() for item in self.items)
+        """Return cart subtotal, kept up to date by add_item/remove_item."""
+        return self._subtotal
 
     def is_empty(self) -> bool:
         """Check if cart is empty."""
-        return len(self.items) == 0
+        return not self._items
 
 
 class TaxCalculator:
@@ -281,26 +335,31 @@ class CouponManager:
     Separates discount logic into its own component.
     """
 
-    def __init__(self):
-        """Initialize coupon database."""
-        self.coupons = {
-            'SAVE10': 0.10,
-            'SAVE20': 0.20,
-            'SUMMER': 0.15
-        }
+    # Coupon database shared by all instances (read-only)
+    _COUPONS = {
+        'SAVE10': 0.10,
+        'SAVE20': 0.20,
+        'SUMMER': 0.15
+    }
 
-    def is_valid(self, code: str) -> bool:
+    @classmethod
+    def is_valid(cls, code: str) -> bool:
         """Check if coupon code is valid."""
-        return code in self.coupons
+        return code in cls._COUPONS
 
-    def get_discount_rate(self, code: str) -> float:
+    @classmethod
+    def get_discount_rate(cls, code: str) -> float:
         """Get discount rate for coupon."""
-        return self.coupons.get(code, 0)
+        return cls._COUPONS.get(code, 0.0)
+
+    @classmethod
+    def apply_if_valid(cls, amount: float, code: str) -> float:
+        """Apply coupon to amount; missing or unknown codes leave it unchanged."""
+        discount_rate = cls._COUPONS.get(code)
+        return amount if discount_rate is None else amount * (1 - discount_rate)
 
-    def apply(self, amount: float, code: str) -> float:
-        """Apply coupon to amount."""
-        discount_rate = self.get_discount_rate(code)
-        return amount * (1 - discount_rate)
+    # Same operation under its original name
+    apply = apply_if_valid
 
 
 class OrderProcessor:
@@ -331,6 +390,7 @@ class OrderProcessor:
         Process order using decomposed components.
 
         Each calculation is delegated to specialized objects.
+        Amounts are returned unrounded; format them for display.
         """
         if cart.is_empty():
             return {'error': 'Cart is empty'}
@@ -341,16 +401,15 @@ class OrderProcessor:
         shipping = self.shipping_calculator.calculate(subtotal)
         total = subtotal + tax + shipping
 
-        # Apply coupon if valid
-        if coupon_code and self.coupon_manager.is_valid(coupon_code):
-            total = self.coupon_manager.apply(total, coupon_code)
+        # Apply coupon if valid (a single lookup; None/unknown codes are a no-op)
+        total = self.coupon_manager.apply_if_valid(total, coupon_code)
 
         return {
             'order_id': generate_order_id(),
-            'subtotal': round(subtotal, 2),
-            'tax': round(tax, 2),
-            'shipping': round(shipping, 2),
-            'total': round(total, 2)
+            'subtotal': subtotal,
+            'tax': tax,
+            'shipping': shipping,
+            'total': total
         }
 
 
@@ -362,49 +421,48 @@ def merge_sort(arr: List[int]) -> List[int]:
     """
     Classic example of algorithmic decomposition.
 
-    Breaks problem into smaller subproblems recursively.
-    Demonstrates divide-and-conquer strategy.
+    Breaks the problem into sorted runs and merges them pairwise.
+    Demonstrates divide-and-conquer strategy, bottom-up: runs of width
+    1, 2, 4, ... are merged back and forth between two preallocated lists.
     """
-    # Base case: array of size 1 or 0 is already sorted
-    if len(arr) <= 1:
-        return arr
-
-    # Divide: split array in half
-    mid = len(arr) // 2
-    left = arr[:mid]
-    right = arr[mid:]
+    n = len(arr)
+    src, dst = list(arr), [None] * n
 
-    # Conquer: recursively sort each half
-    left_sorted = merge_sort(left)
-    right_sorted = merge_sort(right)
+    width = 1
+    while width < n:
+        # Combine: merge each adjacent pair of runs from src into dst
+        for lo in range(0, n, 2 * width):
+            merge(src, dst, lo, min(lo + width, n), min(lo + 2 * width, n))
+        src, dst = dst, src
+        width *= 2
 
-    # Combine: merge sorted halves
-    return merge(left_sorted, right_sorted)
+    return src
 
 
-def merge(left: List[int], right: List[int]) -> List[int]:
+def merge(src: List[int], dst: list, lo: int, mid: int, hi: int) -> None:
     """
-    Helper function: merges two sorted arrays.
+    Helper function: merges sorted runs src[lo:mid] and src[mid:hi] into dst[lo:hi].
 
     Separated from main function for clarity and reusability.
     """
-    result = []
-    i = j = 0
+    i, j, k = lo, mid, lo
 
-    # Merge while both arrays have elements
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            result.append(left[i])
+    # Merge while both runs have elements
+    while i < mid and j < hi:
+        left, right = src[i], src[j]
+        if left <= right:
+            dst[k] = left
             i += 1
         else:
-            result.append(right[j])
+            dst[k] = right
             j += 1
+        k += 1
 
-    # Add remaining elements
-    result.extend(left[i:])
-    result.extend(right[j:])
-
-    return result
+    # Copy remaining elements
+    if i < mid:
+        dst[k:hi] = src[i:mid]
+    else:
+        dst[k:hi] = src[j:hi]
 
 
 # ============================================================================
@@ -420,21 +478,67 @@ class DataStore:
     """
 
     def __init__(self):
-        """Simulate database with dictionary."""
+        """Simulate database with dictionary, plus an email -> user_id index."""
         self._users = {}
+        self._emails = {}
 
     def save_user(self, user_id: str, user_data: dict) -> bool:
-        """Save user to storage."""
+        """Save user to storage; records without an email are stored unindexed."""
+        email = user_data.get('email')
+        previous = self._users.get(user_id)
+        if previous is not None:
+            self._unindex(user_id, previous.get('email'), email)
         self._users[user_id] = user_data
+        if email is not None:
+            self._emails[email] = user_id
         return True
 
+    def _unindex(self, user_id: str, old_email, new_email) -> None:
+        """Drop user_id's old email from the index, unless another user now owns it."""
+        if old_email != new_email and self._emails.get(old_email) == user_id:
+            del self._emails[old_email]
+
+    def save_users_bulk(self, users: Dict[str, dict]) -> int:
+        """Save many users at once with dict.update; returns the count saved."""
+        stored = self._users
+        # Read every email before touching storage, so a bad record leaves both dicts unchanged
+        pairs = [(user_data.get('email'), user_id) for user_id, user_data in users.items()]
+        for user_id in users.keys() & stored.keys():
+            self._unindex(user_id, stored[user_id].get('email'), users[user_id].get('email'))
+        stored.update(users)
+        self._emails.update(pair for pair in pairs if pair[0] is not None)
+        return len(users)
+
     def get_user(self, user_id: str) -> dict:
         """Retrieve user from storage."""
         return self._users.get(user_id)
 
+    def get_user_by_email(self, email: str) -> dict:
+        """Retrieve user from storage by email."""
+        user_id = self._emails.get(email)
+        return None if user_id is None else self._users[user_id]
+
     def user_exists(self, email: str) -> bool:
         """Check if user exists by email."""
-        return any(u.get('email') == email for u in self._users.values())
+        return email in self._emails
+
+
+@lru_cache(maxsize=4)
+def _format_second(second: int, fmt: str) -> str:
+    """Format a whole Unix second; cached so bursts within a second reuse it."""
+    return datetime.fromtimestamp(second).strftime(fmt)
+
+
+def _now(fmt: str = '%Y-%m-%dT%H:%M:%S') -> str:
+    """Current local time to the second (ISO 8601 by default)."""
+    return _format_second(int(time.time()), fmt)
+
+
+# Compiled once at import; _is_valid_email runs on every registration
+_EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+
+# Per-process key so cached verifications never hold plaintext passwords
+_VERIFY_CACHE_KEY = os.urandom(32)
 
 
 # Business Logic Layer
@@ -445,9 +549,18 @@ class UserService:
     Contains rules and processing logic.
     """
 
-    def __init__(self, data_store: DataStore):
-        """Initialize with data store dependency."""
+    def __init__(self, data_store: DataStore, cost: int = 100_000,
+                 verify_cache_size: int = 1024):
+        """
+        Initialize with data store dependency.
+
+        cost is the PBKDF2 iteration count; successful verifications are
+        remembered (up to verify_cache_size) so repeat logins skip the KDF.
+        """
         self.data_store = data_store
+        self.cost = cost
+        self._verify_cache_size = verify_cache_size
+        self._verified = OrderedDict()
 
     def register_user(self, email: str, password: str, name: str) -> Tuple[bool, str]:
         """
@@ -472,7 +585,7 @@ class UserService:
             'email': email,
             'password': self._hash_password(password),
             'name': name,
-            'created_at': datetime.now().isoformat()
+            'created_at': _now()
         }
 
         # Save
@@ -480,16 +593,40 @@ class UserService:
         return True, f"User {email} registered successfully"
 
     def _is_valid_email(self, email: str) -> bool:
-        """Validate email format."""
-        return '@' in email and '.' in email
+        """Validate email format (cheap '@' check rejects most bad input first)."""
+        return '@' in email and _EMAIL_RE.match(email) is not None
 
     def _hash_password(self, password: str) -> str:
-        """Hash password (simplified)."""
-        return f"hashed_{password}"
+        """Hash password with salted PBKDF2-SHA256, stored as algo$cost$salt$hash."""
+        salt = os.urandom(16)
+        digest = hashlib.pbkdf2_hmac('sha256', password.encode(), salt, self.cost)
+        return f"pbkdf2_sha256${self.cost}${salt.hex()}${digest.hex()}"
+
+    def verify_password(self, password: str, stored_hash: str) -> bool:
+        """Check password against a stored hash, caching successful checks."""
+        key = (stored_hash,
+               hmac.new(_VERIFY_CACHE_KEY, password.encode(), 'sha256').digest())
+        if key in self._verified:
+            self._verified.move_to_end(key)
+            return True
+
+        try:
+            _, cost, salt, expected = stored_hash.split('$')
+            digest = hashlib.pbkdf2_hmac('sha256', password.encode(),
+                                         bytes.fromhex(salt), int(cost))
+        except ValueError:
+            return False
+        if not hmac.compare_digest(digest.hex(), expected):
+            return False
+
+        self._verified[key] = None
+        if len(self._verified) > self._verify_cache_size:
+            self._verified.popitem(last=False)
+        return True
 
     def _generate_user_id(self, email: str) -> str:
-        """Generate unique user ID."""
-        return f"user_{hash(email) % 10000}"
+        """Generate unique user ID (stable across processes, unlike hash())."""
+        return f"user_{hashlib.blake2b(email.encode(), digest_size=8).hexdigest()}"
 
 
 # Presentation Layer
@@ -510,14 +647,21 @@ class UserController:
 
         Extracts data, calls service, formats response.
         """
-        email = form_data.get('email', '').strip()
-        password = form_data.get('password', '')
-        name = form_data.get('name', '').strip()
+        get = form_data.get
+        email = (get('email') or '').strip()
+        # A blank email can never register; skip the service (and its KDF)
+        if not email:
+            return self._format_response(False, "Invalid email format")
+        password = get('password') or ''
+        name = (get('name') or '').strip()
 
         # Delegate to service layer
         success, message = self.user_service.register_user(email, password, name)
+        return self._format_response(success, message)
 
-        # Format response for presentation
+    @staticmethod
+    def _format_response(success: bool, message: str) -> dict:
+        """Format response for presentation."""
         return {
             'success': success,
             'message': message,
@@ -556,21 +700,21 @@ class ReportGenerator:
 
     def _generate_summary(self, sales_data: List[dict]) -> str:
         """Module: Generate summary statistics."""
-        total_sales = sum(s['amount'] for s in sales_data)
+        total_sales = sum(map(itemgetter('amount'), sales_data))
         avg_sale = total_sales / len(sales_data) if sales_data else 0
 
         return f"\nTotal Sales: ${total_sales:.2f}\nAverage Sale: ${avg_sale:.2f}\n"
 
     def _generate_details(self, sales_data: List[dict]) -> str:
         """Module: Generate detailed transactions."""
-        details = "\nDetailed Transactions:\n" + "-" * 50 + "\n"
-        for sale in sales_data:
-            details += f"{sale['date']}: ${sale['amount']:.2f} - {sale['item']}\n"
-        return details
+        parts = ["\nDetailed Transactions:\n", "-" * 50, "\n"]
+        parts.extend(f"{sale['date']}: ${sale['amount']:.2f} - {sale['item']}\n"
+                     for sale in sales_data)
+        return "".join(parts)
 
     def _generate_footer(self) -> str:
         """Module: Generate report footer."""
-        return "=" * 50 + f"\nGenerated: {datetime.now().strftime('%Y-%m-%d %H:%M')}"
+        return "=" * 50 + f"\nGenerated: {_now('%Y-%m-%d %H:%M')}"
 
 
 # ============================================================================
@@ -587,7 +731,7 @@ if __name__ == "__main__":
         'coupon': 'SAVE10'
     }
     result = process_order_good(order)
-    print(f"Order Total: ${result['total']}")
+    print(f"Order Total: ${result['total']:.2f}")
 
     print("\n=== CLASS-BASED DECOMPOSITION DEMO ===")
     cart = ShoppingCart()
@@ -597,7 +741,7 @@ if __name__ == "__main__":
     processor = OrderProcessor()
     order_result = processor.process(cart, "SAVE20")
     print(f"Order ID: {order_result['order_id']}")
-    print(f"Total: ${order_result['total']}")
+    print(f"Total: ${order_result['total']:.2f}")
 
     print("\n=== ALGORITHMIC DECOMPOSITION DEMO ===")
     unsorted = [64, 34, 25, 12, 22, 11, 90]
@@ -16,9 +16,16 @@ Benefits:
 
 from typing import List, Dict, Any, Callable, TypeVar, Generic, Protocol
 from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from datetime import datetime
 from functools import reduce
+import json
+import math
 import operator
 
+_PI = math.pi
+_TWO_PI = 2.0 * math.pi
+
 
 # ============================================================================
 # PART 1: FUNCTION GENERALIZATION
@@ -67,10 +74,20 @@ def aggregate(items: List[Any], operation: Callable, initial: Any = None) -> Any
     if not items:
         return initial
 
-    result = initial if initial is not None else items[0]
-    start_idx = 0 if initial is not None else 1
+    # Fast paths: hand well-known operations to their C-level builtins
+    if initial is None:
+        if operation is max or operation is min:
+            return operation(items)
+    elif operation is operator.add and not isinstance(initial, (str, bytes, bytearray)):
+        return sum(items, initial)
+    elif operation is operator.mul:
+        return math.prod(items, start=initial)
+
+    # Iterate in place; the first item seeds the result when no initial is given
+    it = iter(items)
+    result = initial if initial is not None else next(it)
 
-    for item in items[start_idx:]:
+    for item in it:
         result = operation(result, item)
 
     return result
@@ -104,10 +121,11 @@ class CircleSpecific:
         self.radius = radius
 
     def calculate_area(self) -> float:
-        return 3.14159 * self.radius ** 2
+        radius = self.radius
+        return _PI * radius * radius
 
     def calculate_perimeter(self) -> float:
-        return 2 * 3.14159 * self.radius
+        return _TWO_PI * self.radius
 
 
 class RectangleSpecific:
@@ -133,6 +151,8 @@ class Shape(ABC):
     Specific shapes inherit and implement specific behavior.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def area(self) -> float:
         """Calculate area - implemented by subclasses."""
@@ -156,19 +176,24 @@ class Shape(ABC):
 class Circle(Shape):
     """Specific circle implementing general interface."""
 
+    __slots__ = ('radius',)
+
     def __init__(self, radius: float):
         self.radius = radius
 
     def area(self) -> float:
-        return 3.14159 * self.radius ** 2
+        radius = self.radius
+        return _PI * radius * radius
 
     def perimeter(self) -> float:
-        return 2 * 3.14159 * self.radius
+        return _TWO_PI * self.radius
 
 
 class Rectangle(Shape):
     """Specific rectangle implementing general interface."""
 
+    __slots__ = ('width', 'height')
+
     def __init__(self, width: float, height: float):
         self.width = width
         self.height = height
@@ -183,6 +208,8 @@ class Rectangle(Shape):
 class Triangle(Shape):
     """Another specific shape - fits the general pattern."""
 
+    __slots__ = ('base', 'height', 'side1', 'side2')
+
     def __init__(self, base: float, height: float, side1: float, side2: float):
         self.base = base
         self.height = height
@@ -206,6 +233,48 @@ def calculate_total_area(shapes: List[Shape]) -> float:
     return sum(shape.area() for shape in shapes)
 
 
+class ShapeBatch:
+    """
+    Column-wise store of many shapes for bulk area totals.
+
+    Keeps each shape's dimensions in parallel lists (one per field) so
+    total_area() is one C-level map/sum per column instead of an area()
+    call per shape.
+    """
+
+    __slots__ = ('radii', 'rect_widths', 'rect_heights', 'tri_bases', 'tri_heights')
+
+    def __init__(self, shapes: List[Shape] = ()):
+        self.radii: List[float] = []
+        self.rect_widths: List[float] = []
+        self.rect_heights: List[float] = []
+        self.tri_bases: List[float] = []
+        self.tri_heights: List[float] = []
+        for shape in shapes:
+            self.add(shape)
+
+    def add(self, shape: Shape) -> None:
+        """Append a Circle, Rectangle or Triangle to its columns."""
+        kind = type(shape)
+        if kind is Circle:
+            self.radii.append(shape.radius)
+        elif kind is Rectangle:
+            self.rect_widths.append(shape.width)
+            self.rect_heights.append(shape.height)
+        elif kind is Triangle:
+            self.tri_bases.append(shape.base)
+            self.tri_heights.append(shape.height)
+        else:
+            raise TypeError(f"ShapeBatch cannot store {kind.__name__}")
+
+    def total_area(self) -> float:
+        """Sum of all areas, computed per column."""
+        radii = self.radii
+        return (_PI * sum(map(operator.mul, radii, radii))
+                + sum(map(operator.mul, self.rect_widths, self.rect_heights))
+                + 0.5 * sum(map(operator.mul, self.tri_bases, self.tri_heights)))
+
+
 # ============================================================================
 # PART 3: GENERIC TYPES (TYPE PARAMETERS)
 # ============================================================================
@@ -221,9 +290,19 @@ class Stack(Generic[T]):
     we create one generalized Stack[T].
     """
 
-    def __init__(self):
-        """Initialize empty stack."""
-        self._items: List[T] = []
+    __slots__ = ('_items', '_capacity')
+
+    def __init__(self, capacity: int | None = None):
+        """
+        Initialize empty stack.
+
+        A bounded stack (capacity given) is backed by a deque, which grows
+        in fixed-size blocks instead of reallocating and copying like a list.
+        """
+        if capacity is not None and capacity <= 0:
+            raise ValueError("Stack capacity must be positive")
+        self._items = deque() if capacity is not None else []
+        self._capacity = capacity
 
     def push(self, item: T) -> None:
         """
@@ -231,6 +310,8 @@ class Stack(Generic[T]):
 
         Type T is determined when Stack is instantiated.
         """
+        if self._capacity is not None and len(self._items) >= self._capacity:
+            raise OverflowError("Push onto full stack")
         self._items.append(item)
 
     def pop(self) -> T:
@@ -272,10 +353,7 @@ def find_first(items: List[T], predicate: Callable[[T], bool]) -> T | None:
     Returns:
         First matching item or None
     """
-    for item in items:
-        if predicate(item):
-            return item
-    return None
+    return next(filter(predicate, items), None)
 
 
 # ============================================================================
@@ -289,6 +367,8 @@ class PaymentStrategy(ABC):
     Allows different payment methods to be used interchangeably.
     """
 
+    __slots__ = ()
+
     @abstractmethod
     def pay(self, amount: float) -> str:
         """Process payment - implemented by specific strategies."""
@@ -303,6 +383,8 @@ class PaymentStrategy(ABC):
 class CreditCardPayment(PaymentStrategy):
     """Specific strategy: Credit card payment."""
 
+    __slots__ = ('card_number', 'cvv')
+
     def __init__(self, card_number: str, cvv: str):
         self.card_number = card_number
         self.cvv = cvv
@@ -317,6 +399,8 @@ class CreditCardPayment(PaymentStrategy):
 class PayPalPayment(PaymentStrategy):
     """Specific strategy: PayPal payment."""
 
+    __slots__ = ('email',)
+
     def __init__(self, email: str):
         self.email = email
 
@@ -330,6 +414,8 @@ class PayPalPayment(PaymentStrategy):
 class CryptoPayment(PaymentStrategy):
     """Specific strategy: Cryptocurrency payment."""
 
+    __slots__ = ('wallet_address',)
+
     def __init__(self, wallet_address: str):
         self.wallet_address = wallet_address
 
@@ -502,10 +588,28 @@ class JSONProcessor(DataProcessor):
             raise ValueError("Empty JSON")
         return data
 
+    def __init__(self, cache_size: int = 128):
+        """Initialize the LRU cache of parsed documents."""
+        self._parsed: OrderedDict = OrderedDict()
+        self._cache_size = cache_size
+
     def transform(self, data: str) -> Dict:
-        """Transform JSON string to dictionary."""
-        import json
-        return json.loads(data)
+        """
+        Transform JSON string to dictionary.
+
+        Parsing is the expensive step, so parsed documents are cached (LRU)
+        by their source text. The cached object is shared between calls:
+        analyze() and format_output() must only read it.
+        """
+        parsed = self._parsed.get(data)
+        if parsed is None:
+            parsed = json.loads(data)
+            self._parsed[data] = parsed
+            if len(self._parsed) > self._cache_size:
+                self._parsed.popitem(last=False)
+        else:
+            self._parsed.move_to_end(data)
+        return parsed
 
     def analyze(self, data: Dict) -> Dict[str, int]:
         """Count keys in JSON."""
@@ -522,7 +626,7 @@ def apply_operation(data: List[T], operation: Callable[[T], Any]) -> List[Any]:
 
     Applies any operation to any data type.
     """
-    return [operation(item) for item in data]
+    return list(map(operation, data))
 
 
 def filter_items(data: List[T], condition: Callable[[T], bool]) -> List[T]:
@@ -531,7 +635,7 @@ def filter_items(data: List[T], condition: Callable[[T], bool]) -> List[T]:
 
     Filters any data based on any condition.
     """
-    return [item for item in data if condition(item)]
+    return list(filter(condition, data))
 
 
 def compose(*functions: Callable) -> Callable:
@@ -541,11 +645,29 @@ def compose(*functions: Callable) -> Callable:
     Combines multiple functions into one.
 
     Example: compose(f, g, h)(x) == f(g(h(x)))
-    """
+
+    The call order is fixed once here; short chains get straight-line
+    closures with no loop at call time.
+    """
+    funcs = tuple(reversed(functions))
+
+    if not funcs:
+        return lambda arg: arg
+    if len(funcs) == 1:
+        return funcs[0]
+    if len(funcs) == 2:
+        f0, f1 = funcs
+        return lambda arg: f1(f0(arg))
+    if len(funcs) == 3:
+        f0, f1, f2 = funcs
+        return lambda arg: f2(f1(f0(arg)))
+    if len(funcs) == 4:
+        f0, f1, f2, f3 = funcs
+        return lambda arg: f3(f2(f1(f0(arg))))
 
     def inner(arg):
         result = arg
-        for func in reversed(functions):
+        for func in funcs:
             result = func(result)
         return result
 
@@ -563,12 +685,34 @@ class JSONSerializableMixin:
     Can be mixed into any class to add JSON serialization.
     """
 
+    __slots__ = ()
+
+    _json_fields: tuple = ()
+    _json_uses_dict = True
+
+    def __init_subclass__(cls, **kwargs):
+        """Collect the public slot fields once, when the subclass is defined."""
+        super().__init_subclass__(**kwargs)
+        fields = []
+        for klass in reversed(cls.__mro__):
+            slots = klass.__dict__.get('__slots__', ())
+            if isinstance(slots, str):
+                slots = (slots,)
+            fields.extend(name for name in slots if not name.startswith('_'))
+        cls._json_fields = tuple(fields)
+        # Any class in the MRO without __slots__ gives instances a __dict__
+        cls._json_uses_dict = any('__slots__' not in vars(klass)
+                                  for klass in cls.__mro__ if klass is not object)
+
     def to_json(self) -> Dict[str, Any]:
         """Convert object to JSON-serializable dictionary."""
-        return {
-            key: value for key, value in self.__dict__.items()
-            if not key.startswith('_')
-        }
+        data = {name: getattr(self, name) for name in self._json_fields}
+        if self._json_uses_dict:
+            data.update(
+                (key, value) for key, value in self.__dict__.items()
+                if not key.startswith('_')
+            )
+        return data
 
 
 class TimestampMixin:
@@ -578,15 +722,17 @@ class TimestampMixin:
     Adds creation and update tracking to any class.
     """
 
+    # No layout of its own so it can mix with any slotted class; users of the
+    # mixin declare created_at/updated_at in their own __slots__
+    __slots__ = ()
+
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        from datetime import datetime
         self.created_at = datetime.now()
         self.updated_at = datetime.now()
 
     def touch(self) -> None:
         """Update the timestamp."""
-        from datetime import datetime
         self.updated_at = datetime.now()
 
 
@@ -597,6 +743,8 @@ class User(JSONSerializableMixin, TimestampMixin):
     Gets JSON serialization and timestamps without reimplementing.
     """
 
+    __slots__ = ('created_at', 'updated_at', 'username', 'email')
+
     def __init__(self, username: str, email: str):
         super().__init__()
         self.username = username
@@ -610,6 +758,8 @@ class Article(JSONSerializableMixin, TimestampMixin):
     Same mixins provide same functionality to different classes.
     """
 
+    __slots__ = ('created_at', 'updated_at', 'title', 'content')
+
     def __init__(self, title: str, content: str):
         super().__init__()
         self.title = title
@@ -636,6 +786,7 @@ if __name__ == "__main__":
     for shape in shapes:
         print(shape.describe())
     print(f"Total Area: {calculate_total_area(shapes):.2f}")
+    print(f"Batched Total Area: {ShapeBatch(shapes).total_area():.2f}")
 
     print("\n=== GENERIC TYPES ===")
     int_stack = Stack[int]()
@@ -18,6 +18,12 @@ maintainable, and testable code.
 """
 
 from abc import ABC, abstractmethod
+from enum import IntEnum
+import hashlib
+import hmac
+import os
+import sys
+import weakref
 from typing import List, Protocol
 from dataclasses import dataclass
 
@@ -137,6 +143,8 @@ class Cat(Animal):
 class Vehicle:
     """Base class for vehicles."""
 
+    __slots__ = ('brand', 'model')
+
     def __init__(self, brand: str, model: str):
         self.brand = brand
         self.model = model
@@ -148,6 +156,8 @@ class Vehicle:
 class Car(Vehicle):
     """Car inherits from Vehicle."""
 
+    __slots__ = ('doors',)
+
     def __init__(self, brand: str, model: str, doors: int):
         super().__init__(brand, model)
         self.doors = doors
@@ -175,8 +185,16 @@ class ElectricCar(Car):
     Inheritance becomes rigid and problematic.
     """
 
+    __slots__ = ('battery_capacity',)
+
     def __init__(self, brand: str, model: str, doors: int, battery_capacity: int):
-        super().__init__(brand, model, doors)
+        # Assigns the inherited fields itself rather than chaining through
+        # Car.__init__ -> Vehicle.__init__ (two extra frames per instance).
+        # The catch is the tight coupling above: this now repeats what the
+        # parents set up, and must change whenever they do.
+        self.brand = brand
+        self.model = model
+        self.doors = doors
         self.battery_capacity = battery_capacity
 
     def charge_battery(self) -> str:
@@ -210,25 +228,38 @@ class Engine:
     - No inheritance hierarchy needed
     """
 
+    __slots__ = ('_engine_type', '_horsepower', 'running', '_start_msg', '_stop_msg')
+
     def __init__(self, engine_type: str, horsepower: int):
         """Initialize engine specifications."""
-        self.engine_type = engine_type
-        self.horsepower = horsepower
-        self._running = False
+        self._engine_type = engine_type
+        self._horsepower = horsepower
+        self.running = False  # Read directly by composed vehicles
+        # Specs are read-only, so the status messages can be built once
+        self._start_msg = f"{engine_type} engine started ({horsepower}hp)"
+        self._stop_msg = f"{engine_type} engine stopped"
+
+    @property
+    def engine_type(self) -> str:
+        return self._engine_type
+
+    @property
+    def horsepower(self) -> int:
+        return self._horsepower
 
     def start(self) -> str:
         """Start the engine."""
-        self._running = True
-        return f"{self.engine_type} engine started ({self.horsepower}hp)"
+        self.running = True
+        return self._start_msg
 
     def stop(self) -> str:
         """Stop the engine."""
-        self._running = False
-        return f"{self.engine_type} engine stopped"
+        self.running = False
+        return self._stop_msg
 
     def is_running(self) -> bool:
         """Check if engine is running."""
-        return self._running
+        return self.running
 
 
 class ElectricMotor:
@@ -239,23 +270,31 @@ class ElectricMotor:
     without forcing them into an inheritance hierarchy.
     """
 
+    __slots__ = ('battery_capacity', '_motor_power', '_charge_level', 'running', '_start_msg')
+
     def __init__(self, battery_capacity: int, motor_power: int):
         """Initialize electric motor specifications."""
         self.battery_capacity = battery_capacity
-        self.motor_power = motor_power
+        self._motor_power = motor_power
         self._charge_level = 100
-        self._active = False
+        self.running = False
+        # motor_power is read-only, so the activation message can be built once
+        self._start_msg = f"Electric motor activated ({motor_power}kW)"
+
+    @property
+    def motor_power(self) -> int:
+        return self._motor_power
 
     def start(self) -> str:
         """Activate electric motor."""
         if self._charge_level > 0:
-            self._active = True
-            return f"Electric motor activated ({self.motor_power}kW)"
+            self.running = True
+            return self._start_msg
         return "Battery too low to start"
 
     def stop(self) -> str:
         """Deactivate electric motor."""
-        self._active = False
+        self.running = False
         return "Electric motor deactivated"
 
     def charge(self) -> str:
@@ -265,7 +304,7 @@ class ElectricMotor:
 
     def is_running(self) -> bool:
         """Check if motor is active."""
-        return self._active
+        return self.running
 
 
 class Wheels:
@@ -276,14 +315,26 @@ class Wheels:
     without forcing them into same inheritance tree.
     """
 
+    __slots__ = ('_count', '_size', '_rotate_msg')
+
     def __init__(self, count: int, size: int):
         """Initialize wheel specifications."""
-        self.count = count
-        self.size = size
+        self._count = count
+        self._size = size
+        # count and size are read-only, so the message can be built once
+        self._rotate_msg = f"{count} wheels rotating (size: {size} inches)"
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    @property
+    def size(self) -> int:
+        return self._size
 
     def rotate(self) -> str:
         """Rotate wheels for movement."""
-        return f"{self.count} wheels rotating (size: {self.size} inches)"
+        return self._rotate_msg
 
 
 class GPS:
@@ -294,6 +345,8 @@ class GPS:
     without changing inheritance hierarchy.
     """
 
+    __slots__ = ('_location',)
+
     def __init__(self):
         """Initialize GPS system."""
         self._location = "Unknown"
@@ -328,6 +381,8 @@ class ModernCar:
     - Car HAS-A GPS (optional)
     """
 
+    __slots__ = ('brand', 'model', '_engine', '_wheels', '_gps')
+
     def __init__(
             self,
             brand: str,
@@ -363,7 +418,7 @@ class ModernCar:
 
         Combines engine and wheels functionality.
         """
-        if not self._engine.is_running():
+        if not self._engine.running:
             return "Cannot drive - engine not started"
         return f"Driving with {self._wheels.rotate()}"
 
@@ -400,6 +455,8 @@ class ModernElectricCar:
     - No baggage from parent class assumptions
     """
 
+    __slots__ = ('brand', 'model', '_motor', '_wheels', '_gps')
+
     def __init__(
             self,
             brand: str,
@@ -420,7 +477,7 @@ class ModernElectricCar:
 
     def drive(self) -> str:
         """Drive using electric motor."""
-        if not self._motor.is_running():
+        if not self._motor.running:
             return "Cannot drive - motor not activated"
         return f"Driving silently with {self._wheels.rotate()}"
 
@@ -435,6 +492,12 @@ class ModernElectricCar:
         return self._gps.navigate_to(destination)
 
 
+class Mode(IntEnum):
+    """HybridCar drive modes; values index HybridCar's driver table."""
+    ELECTRIC = 0
+    GAS = 1
+
+
 class HybridCar:
     """
     Hybrid car with BOTH gas engine AND electric motor.
@@ -447,6 +510,8 @@ class HybridCar:
     This demonstrates why composition is more flexible.
     """
 
+    __slots__ = ('brand', 'model', '_engine', '_motor', '_wheels', '_mode')
+
     def __init__(
             self,
             brand: str,
@@ -465,7 +530,7 @@ class HybridCar:
         self._engine = engine
         self._motor = motor
         self._wheels = wheels
-        self._mode = "electric"  # Default to electric mode
+        self._mode = Mode.ELECTRIC  # Default to electric mode
 
     def start(self) -> str:
         """Start in electric mode by default."""
@@ -476,24 +541,33 @@ class HybridCar:
         """Switch to gas engine mode."""
         self._motor.stop()
         self._engine.start()
-        self._mode = "gas"
+        self._mode = Mode.GAS
         return "Switched to gas engine mode"
 
     def switch_to_electric(self) -> str:
         """Switch to electric motor mode."""
         self._engine.stop()
         self._motor.start()
-        self._mode = "electric"
+        self._mode = Mode.ELECTRIC
         return "Switched to electric motor mode"
 
-    def drive(self) -> str:
-        """Drive using current mode."""
-        if self._mode == "electric" and self._motor.is_running():
+    def _drive_electric(self) -> str:
+        if self._motor.running:
             return f"Driving on electric: {self._wheels.rotate()}"
-        elif self._mode == "gas" and self._engine.is_running():
+        return "No power source active"
+
+    def _drive_gas(self) -> str:
+        if self._engine.running:
             return f"Driving on gas: {self._wheels.rotate()}"
         return "No power source active"
 
+    # Indexed by Mode, so drive() needs no per-mode comparisons
+    _DRIVERS = (_drive_electric, _drive_gas)
+
+    def drive(self) -> str:
+        """Drive using current mode."""
+        return self._DRIVERS[self._mode](self)
+
 
 # ============================================================================
 # PART 5: INTERFACE-BASED COMPOSITION (PROTOCOL)
@@ -524,6 +598,29 @@ class PowerSource(Protocol):
         ...
 
 
+_POWER_SOURCE_METHODS = ("start", "stop", "is_running")
+
+# Classes already known to provide the PowerSource methods
+_POWER_SOURCE_TYPES: "weakref.WeakSet[type]" = weakref.WeakSet()
+
+
+def _is_power_source(obj: object) -> bool:
+    """
+    Check obj against PowerSource.
+
+    Classes that pass are remembered, so later vehicles with that class
+    skip the check. Objects carrying the methods themselves (namespaces,
+    mocks) are checked on the instance each time.
+    """
+    cls = type(obj)
+    if cls in _POWER_SOURCE_TYPES:
+        return True
+    if all(callable(getattr(cls, name, None)) for name in _POWER_SOURCE_METHODS):
+        _POWER_SOURCE_TYPES.add(cls)
+        return True
+    return all(callable(getattr(obj, name, None)) for name in _POWER_SOURCE_METHODS)
+
+
 class UniversalVehicle:
     """
     Vehicle that works with ANY power source matching the protocol.
@@ -536,6 +633,8 @@ class UniversalVehicle:
     This is composition over inheritance at its finest!
     """
 
+    __slots__ = ('brand', 'model', '_power_source', '_wheels', '_start_fn', '_running_fn')
+
     def __init__(
             self,
             brand: str,
@@ -549,10 +648,15 @@ class UniversalVehicle:
         Type hint says "any object matching PowerSource protocol"
         Don't care if it's Engine, ElectricMotor, or NuclearReactor!
         """
+        if not _is_power_source(power_source):
+            raise TypeError(f"{type(power_source).__name__} does not implement PowerSource")
         self.brand = brand
         self.model = model
         self._power_source = power_source
         self._wheels = wheels
+        # The power source is fixed for the vehicle's lifetime; bind its methods once
+        self._start_fn = power_source.start
+        self._running_fn = power_source.is_running
 
     def start(self) -> str:
         """
@@ -560,11 +664,11 @@ class UniversalVehicle:
 
         Works with ANY object that has start() method!
         """
-        return f"{self.brand} {self.model}: {self._power_source.start()}"
+        return f"{self.brand} {self.model}: {self._start_fn()}"
 
     def drive(self) -> str:
         """Drive using any power source."""
-        if not self._power_source.is_running():
+        if not self._running_fn():
             return "Cannot drive - power source not active"
         return f"Driving with {self._wheels.rotate()}"
 
@@ -574,22 +678,77 @@ class UniversalVehicle:
 # ============================================================================
 
 class Logger:
-    """Component for logging functionality."""
+    """
+    Component for logging functionality.
+
+    Buffers messages and writes them in batches; call flush() when done
+    so the last partial batch is written. Like the stdlib logging module,
+    log() takes a %-style template and args, formatted only when written
+    (never, if the logger is disabled). Args are held by reference until
+    then, so a mutable arg is logged in its state at flush time.
+    """
+
+    __slots__ = ('_buffer', '_limit', 'enabled')
+
+    def __init__(self, limit: int = 256, enabled: bool = True):
+        self._buffer: List[tuple] = []
+        self._limit = limit
+        self.enabled = enabled
 
-    def log(self, message: str) -> None:
+    def log(self, message: str, *args) -> None:
         """Log a message."""
-        print(f"[LOG] {message}")
+        if not self.enabled:
+            return
+        self._buffer.append((message, args))
+        if len(self._buffer) >= self._limit:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write all buffered messages with a single stdout write."""
+        if self._buffer:
+            try:
+                lines = [self._format(message, args) for message, args in self._buffer]
+                sys.stdout.write("[LOG] " + "\n[LOG] ".join(lines) + "\n")
+            finally:
+                self._buffer.clear()
+
+    @staticmethod
+    def _format(message: str, args: tuple) -> str:
+        """Format one entry; a bad template/args pair is logged as its repr."""
+        if not args:
+            return message
+        try:
+            return message % args
+        except (TypeError, ValueError, KeyError):
+            return f"Unformattable log message: {message!r} % {args!r}"
 
 
 class Authenticator:
     """Component for authentication."""
 
+    # PBKDF2 iteration count, as in decomposition.py's UserService
+    _COST = 100_000
+
+    # Checked against when the username is unknown, so both paths run the KDF
+    _NO_USER = (bytes(16), bytes(32))
+
     def __init__(self):
-        self._users = {"admin": "password123"}
+        # Only (salt, salted PBKDF2 digest) pairs are kept, never plaintext
+        self._users = {}
+        self.add_user("admin", "password123")
+
+    def add_user(self, username: str, password: str) -> None:
+        """Store a credential under a fresh random salt."""
+        salt = os.urandom(16)
+        self._users[username] = (salt, self._hash(password, salt))
+
+    def _hash(self, password: str, salt: bytes) -> bytes:
+        return hashlib.pbkdf2_hmac('sha256', password.encode(), salt, self._COST)
 
     def authenticate(self, username: str, password: str) -> bool:
-        """Authenticate user."""
-        return self._users.get(username) == password
+        """Authenticate user with a constant-time digest comparison."""
+        salt, expected = self._users.get(username, self._NO_USER)
+        return hmac.compare_digest(expected, self._hash(password, salt))
 
 
 class DatabaseConnection:
@@ -606,6 +765,14 @@ class DatabaseConnection:
         """Retrieve data from database."""
         return self._data.get(key)
 
+    def try_insert(self, key: str, value: any) -> bool:
+        """Save data only if key is new; returns whether it was saved."""
+        # One setdefault probe; the size changes only when the key was absent.
+        # (Comparing the returned value with `is` would misfire on interned values.)
+        size = len(self._data)
+        self._data.setdefault(key, value)
+        return len(self._data) != size
+
 
 class UserService:
     """
@@ -628,6 +795,8 @@ class UserService:
     - Composition is clean and simple
     """
 
+    __slots__ = ('_logger', '_authenticator', '_database')
+
     def __init__(
             self,
             logger: Logger,
@@ -653,14 +822,13 @@ class UserService:
         - Database handles storage
         - This class just orchestrates
         """
-        self._logger.log(f"Attempting to register user: {username}")
+        self._logger.log("Attempting to register user: %s", username)
 
-        if self._database.get(username):
-            self._logger.log(f"Registration failed: {username} already exists")
+        if not self._database.try_insert(username, password):
+            self._logger.log("Registration failed: %s already exists", username)
             return False
 
-        self._database.save(username, password)
-        self._logger.log(f"User registered successfully: {username}")
+        self._logger.log("User registered successfully: %s", username)
         return True
 
     def login(self, username: str, password: str) -> bool:
@@ -669,13 +837,13 @@ class UserService:
 
         Delegates authentication to Authenticator component.
         """
-        self._logger.log(f"Login attempt: {username}")
+        self._logger.log("Login attempt: %s", username)
 
         if self._authenticator.authenticate(username, password):
-            self._logger.log(f"Login successful: {username}")
+            self._logger.log("Login successful: %s", username)
             return True
 
-        self._logger.log(f"Login failed: {username}")
+        self._logger.log("Login failed: %s", username)
         return False
 
 
@@ -757,15 +925,12 @@ if __name__ == "__main__":
     dog = Dog("Buddy", 5, "Golden Retriever")
     cat = Cat("Whiskers", 3, True)
 
-    print(dog.make_sound())
-    print(dog.fetch())
-    print(cat.make_sound())
-    print(cat.scratch())
+    # Each section collects its lines and prints them with one write
+    print("\n".join([dog.make_sound(), dog.fetch(), cat.make_sound(), cat.scratch()]))
 
     # Polymorphism: treating different animals uniformly
     animals: List[Animal] = [dog, cat]
-    for animal in animals:
-        print(animal.eat())
+    print("\n".join([animal.eat() for animal in animals]))
 
     print("\n=== COMPOSITION DEMO ===")
 
@@ -777,15 +942,11 @@ if __name__ == "__main__":
 
     # Build gas car with composition
     gas_car = ModernCar("Toyota", "Camry", gas_engine, car_wheels, gps)
-    print(gas_car.start())
-    print(gas_car.drive())
-    print(gas_car.navigate("Downtown"))
+    print("\n".join([gas_car.start(), gas_car.drive(), gas_car.navigate("Downtown")]))
 
     # Build electric car with composition
     electric_car = ModernElectricCar("Tesla", "Model 3", electric_motor, car_wheels)
-    print(electric_car.start())
-    print(electric_car.drive())
-    print(electric_car.charge())
+    print("\n".join([electric_car.start(), electric_car.drive(), electric_car.charge()]))
 
     # Add GPS later (impossible with pure inheritance!)
     electric_car._gps = GPS()
@@ -797,18 +958,14 @@ if __name__ == "__main__":
     hybrid_wheels = Wheels(4, 17)
 
     hybrid = HybridCar("Toyota", "Prius", hybrid_engine, hybrid_motor, hybrid_wheels)
-    print(hybrid.start())
-    print(hybrid.drive())
-    print(hybrid.switch_to_gas())
-    print(hybrid.drive())
+    print("\n".join([hybrid.start(), hybrid.drive(), hybrid.switch_to_gas(), hybrid.drive()]))
 
     print("\n=== PROTOCOL-BASED COMPOSITION ===")
     # UniversalVehicle works with ANY PowerSource
     universal1 = UniversalVehicle("Generic", "V1", Engine("V8", 400), car_wheels)
     universal2 = UniversalVehicle("Generic", "V2", ElectricMotor(100, 250), car_wheels)
 
-    print(universal1.start())
-    print(universal2.start())
+    print("\n".join([universal1.start(), universal2.start()]))
 
     print("\n=== DELEGATION PATTERN ===")
     logger = Logger()
@@ -818,4 +975,5 @@ if __name__ == "__main__":
     user_service = UserService(logger, auth, db)
     user_service.register_user("alice", "secure_password")
     user_service.login("alice", "secure_password")
-    user_service.login("alice", "wrong_password")
\ No newline at end of file
+    user_service.login("alice", "wrong_password")
+    logger.flush()
\ No newline at end of file
@@ -1,4 +1,6 @@
 class Circle:
+    __slots__ = ('_radius',)
+
     def __init__(self, radius):
         self._radius = radius
 
@@ -37,6 +39,8 @@ if __name__ == '__main__':
 
 
 class Circle:
+    __slots__ = ('_radius',)
+
     def __init__(self, radius):
         self._radius = radius
 
@@ -51,7 +55,10 @@ class Circle:
         self._radius = value
 
     def __call__(self, new_radius):
-        self.radius = new_radius
+        # Same check as the setter, written straight to the slot for fast chaining
+        if new_radius < 0:
+            raise ValueError("Radius Cannot be Negative")
+        self._radius = new_radius
         return self  # Return self for chaining
 
     def __repr__(self):